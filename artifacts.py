@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Penyimpanan dan pemuatan artefak model hasil pelatihan.
+
+Satu artefak adalah sebuah direktori berisi:
+- `manifest.json`: versi format, urutan kolom, fingerprint data latih, daftar model dan metrik.
+- `preprocessor.joblib` dan `models/<nama>.joblib`: objek scikit-learn yang sudah di-fit
+  (preprocessor dari `preprocessing.build_preprocessor`).
+- `scorer.npz`: preprocessing dan Logistic Regression yang sudah dilipat menjadi nilai
+  imputasi, bobot dan bias untuk fitur mentah (lihat `scoring.LinearScorer`), sehingga
+  prediksi dapat dilakukan tanpa mengimpor scikit-learn.
+- `forest.npz`: preprocessing dan Random Forest yang sudah dikemas menjadi array datar
+  (lihat `scoring.ForestScorer`), juga tanpa scikit-learn.
+
+Modul ini sengaja hanya mengimpor pustaka standar dan NumPy di level modul agar
+`predict.py` tetap cepat saat mulai.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+
+from scoring import ForestScorer, LinearScorer
+
+ARTIFACT_VERSION = 4
+DEFAULT_ARTIFACT_DIR = os.path.join("artifacts", "latest")
+LINEAR_MODEL_NAME = "Logistic Regression"
+FOREST_MODEL_NAME = "Random Forest"
+
+
+def dataset_fingerprint(path, block_size=1 << 20):
+    """Fingerprint file data latih: hash SHA-256 dari isi file beserta ukurannya."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+            size += len(block)
+    return {"sha256": digest.hexdigest(), "bytes": size, "source": os.path.basename(path)}
+
+
+def safe_filename(name):
+    """Nama model sebagai bagian nama file: huruf kecil, karakter non-alfanumerik menjadi `_`."""
+    return re.sub(r"\W+", "_", name.lower()).strip("_")
+
+
+def _model_filename(name):
+    return safe_filename(name) + ".joblib"
+
+
+def save_artifact(directory, preprocessor, models, columns, fingerprint, metrics=None):
+    """Menyimpan preprocessor, dict `models`, urutan kolom dan fingerprint data ke `directory`."""
+    import joblib
+    import sklearn
+
+    os.makedirs(os.path.join(directory, "models"), exist_ok=True)
+    joblib.dump(preprocessor, os.path.join(directory, "preprocessor.joblib"))
+
+    model_files = {}
+    for name, model in models.items():
+        model_files[name] = os.path.join("models", _model_filename(name))
+        joblib.dump(model, os.path.join(directory, model_files[name]))
+
+    if LINEAR_MODEL_NAME in models:
+        LinearScorer.from_sklearn(preprocessor, models[LINEAR_MODEL_NAME], columns).save(os.path.join(directory, "scorer.npz"))
+    if FOREST_MODEL_NAME in models:
+        ForestScorer.from_sklearn(preprocessor, models[FOREST_MODEL_NAME], columns).save(os.path.join(directory, "forest.npz"))
+
+    manifest = {
+        "artifact_version": ARTIFACT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sklearn_version": sklearn.__version__,
+        "columns": list(columns),
+        "data_fingerprint": fingerprint,
+        "models": model_files,
+        "metrics": metrics or {},
+    }
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_manifest(directory):
+    with open(os.path.join(directory, "manifest.json")) as f:
+        manifest = json.load(f)
+    if manifest.get("artifact_version") != ARTIFACT_VERSION:
+        raise ValueError(f"Versi artefak {manifest.get('artifact_version')} tidak didukung "
+                         f"(diharapkan {ARTIFACT_VERSION}). Jalankan ulang train.py.")
+    return manifest
+
+
+def load_preprocessor(directory):
+    import joblib
+    return joblib.load(os.path.join(directory, "preprocessor.joblib"))
+
+
+def load_model(directory, name=LINEAR_MODEL_NAME, manifest=None):
+    import joblib
+    manifest = manifest or load_manifest(directory)
+    if name not in manifest["models"]:
+        raise KeyError(f"Model '{name}' tidak ada di artefak. Pilihan: {list(manifest['models'])}")
+    return joblib.load(os.path.join(directory, manifest["models"][name]))
+
+
+def load_scorer(directory):
+    """Memuat `LinearScorer` (Logistic Regression terlipat) dari artefak."""
+    return LinearScorer.load(os.path.join(directory, "scorer.npz"))
+
+
+def load_forest(directory):
+    """Memuat `ForestScorer` (Random Forest terkompilasi) dari artefak."""
+    return ForestScorer.load(os.path.join(directory, "forest.npz"))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Prediksi batch untuk banyak pasien sekaligus.
+
+Data pasien (CSV atau array dengan 8 kolom fitur) diproses per chunk besar:
+preprocessing dengan transformer yang sudah di-fit (`StandardScaler` dari notebook
+atau preprocessor dari artefak), prediksi dengan model
+Logistic Regression, lalu indikator risiko dihitung sebagai mask boolean per kolom.
+
+Contoh penggunaan (setelah menjalankan `python train.py`):
+    python batch_scoring.py pasien.csv --output hasil.csv
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from artifacts import DEFAULT_ARTIFACT_DIR, LINEAR_MODEL_NAME, load_model, load_preprocessor
+from instrumentation import stage
+from schema import FEATURE_COLUMNS
+from scoring import risk_flags
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+
+def _score_chunk(X, scaler, model):
+    # Kolom diberi nama hanya jika transformer di-fit dari DataFrame (seperti pada submission.py)
+    X_input = pd.DataFrame(X, columns=FEATURE_COLUMNS) if hasattr(scaler, "feature_names_in_") else X
+    X_scaled = scaler.transform(X_input)
+    if hasattr(model, "feature_names_in_"):
+        X_scaled = pd.DataFrame(X_scaled, columns=model.feature_names_in_)
+    probability = model.predict_proba(X_scaled)[:, 1]
+    # Setara dengan model.predict() untuk Logistic Regression, tanpa menghitung ulang decision function
+    prediction = (probability > 0.5).astype(np.int8)
+
+    result = pd.DataFrame({"Prediction": prediction, "Probability": probability})
+    for name, mask in risk_flags(X).items():
+        result[name] = mask
+    return result
+
+
+def score_batch(X, scaler, model, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Memprediksi seluruh baris `X` (array atau DataFrame dengan 8 kolom fitur).
+
+    Mengembalikan satu DataFrame berisi prediksi, probabilitas diabetes dan flag risiko per baris.
+    """
+    if isinstance(X, pd.DataFrame):
+        X = X[FEATURE_COLUMNS].to_numpy()
+    X = np.asarray(X)
+    if X.ndim != 2 or X.shape[1] != len(FEATURE_COLUMNS):
+        raise ValueError(f"Data harus memiliki {len(FEATURE_COLUMNS)} kolom fitur: {FEATURE_COLUMNS}")
+
+    if not len(X):
+        # Transformer scikit-learn menolak input 0 baris; hasil kosong dengan kolom yang sama
+        result = pd.DataFrame({"Prediction": np.empty(0, dtype=np.int8), "Probability": np.empty(0)})
+        for name, mask in risk_flags(X).items():
+            result[name] = mask
+        return result
+
+    with stage("prediction", rows=len(X)):
+        parts = [_score_chunk(X[start:start + chunk_size], scaler, model)
+                 for start in range(0, len(X), chunk_size)]
+    return pd.concat(parts, ignore_index=True)
+
+
+def iter_score_csv(path, scaler, model, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Membaca dan memprediksi file CSV per chunk, menghasilkan DataFrame hasil untuk setiap chunk."""
+    for chunk in pd.read_csv(path, usecols=FEATURE_COLUMNS, chunksize=chunk_size):
+        yield score_batch(chunk, scaler, model, chunk_size=chunk_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prediksi batch pasien dari file CSV.")
+    parser.add_argument("input", help="File CSV berisi 8 kolom fitur pasien")
+    parser.add_argument("--output", help="File CSV hasil prediksi (default: tampilkan ringkasan)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--artifact", default=DEFAULT_ARTIFACT_DIR, help="Direktori artefak dari train.py")
+    args = parser.parse_args()
+
+    preprocessor = load_preprocessor(args.artifact)
+    model = load_model(args.artifact, LINEAR_MODEL_NAME)
+
+    start = time.perf_counter()
+    n_rows = 0
+    parts = []
+    for result in iter_score_csv(args.input, preprocessor, model, chunk_size=args.chunk_size):
+        if args.output:
+            # Hasil ditulis bertahap agar memori tidak bertambah seiring ukuran file
+            result.to_csv(args.output, mode="w" if n_rows == 0 else "a", header=n_rows == 0, index=False)
+        else:
+            parts.append(result)
+        n_rows += len(result)
+    elapsed = time.perf_counter() - start
+
+    if parts:
+        print(pd.concat(parts, ignore_index=True))
+    print(f"Jumlah baris: {n_rows} | Waktu: {elapsed:.2f} detik | {n_rows / max(elapsed, 1e-9):,.0f} baris/detik")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""Benchmark tahapan pipeline pada dataset sintetis berukuran besar.
+
+Dataset sintetis dibuat dengan resampling baris `dataset.csv` lalu diberi jitter
+kecil. Setiap tahapan submission.py (load, describe/corr, duplicated, normalisasi,
+train_test_split, fit/predict setiap model, metrik, prediksi satu baris vs batch)
+diukur waktunya dan puncak memorinya, lalu disimpan sebagai JSON agar hasil
+antar-run dapat dibandingkan.
+
+Mode `--scorer` membandingkan jalur prediksi scikit-learn (`preprocessor.transform`
++ `predict_proba`) dengan `scoring.LinearScorer` (NumPy murni) dari artefak: waktu
+impor, baris/detik untuk float64, float32 dan array memmap, serta selisih probabilitas.
+
+Mode `--forest` membandingkan `RandomForestClassifier.predict_proba` dengan
+`scoring.ForestScorer` (pohon terkompilasi) dari artefak untuk ukuran batch 1 hingga
+1 juta baris: latensi per panggilan, puncak memori, ukuran model dan kesamaan hasil.
+
+Contoh penggunaan:
+    python benchmark.py --sizes 10000 100000 1000000 --output bench_results.json
+    python benchmark.py --sizes 100000 --baseline bench_results.json
+    python benchmark.py --scorer --sizes 1000000 --output bench_scorer.json
+    python benchmark.py --forest --output bench_forest.json
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import train_test_split
+
+from artifacts import (DEFAULT_ARTIFACT_DIR, FOREST_MODEL_NAME, LINEAR_MODEL_NAME, load_forest, load_model,
+                       load_preprocessor, load_scorer)
+from batch_scoring import score_batch
+from dedup import duplicated_in_batch, row_hashes
+from instrumentation import max_rss_mb
+from pipeline import build_models, evaluate
+from preprocessing import build_preprocessor
+from schema import ALL_COLUMNS, FEATURE_COLUMNS, TARGET_COLUMN
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_BATCH_SIZES = [1, 10, 100, 1_000, 10_000, 100_000, 1_000_000]
+# SVC eksak (kernel RBF) berskala kuadratik terhadap jumlah baris; di atas batas ini fit dilewati.
+# Varian Nystroem selalu diukur.
+DEFAULT_MAX_SVM_ROWS = 20_000
+FLOAT_COLUMNS = ['BMI', 'DiabetesPedigreeFunction']
+
+
+def make_synthetic(source, n_rows, jitter=0.05, random_state=42):
+    """Resampling baris `source` dengan pengembalian lalu menambah noise Gaussian.
+
+    Noise berskala `jitter` x standar deviasi kolom; kolom integer dibulatkan dan
+    semua fitur dijaga tidak negatif. Kolom `Outcome` tidak diubah.
+    """
+    rng = np.random.default_rng(random_state)
+    sample = source.iloc[rng.integers(0, len(source), n_rows)].reset_index(drop=True)
+    for col in FEATURE_COLUMNS:
+        values = sample[col].to_numpy(dtype=np.float64)
+        values = np.clip(values + rng.normal(0, jitter * source[col].std(), n_rows), 0, None)
+        sample[col] = values.round(3) if col in FLOAT_COLUMNS else values.round().astype(np.int64)
+    return sample[ALL_COLUMNS]
+
+
+class StageRecorder:
+    """Mencatat waktu dan puncak memori (tracemalloc) setiap tahapan."""
+
+    def __init__(self, rows, track_memory=True):
+        self.rows = rows
+        self.track_memory = track_memory
+        self.records = []
+
+    @contextmanager
+    def stage(self, name, **extra):
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        record = {"rows": self.rows, "stage": name, "seconds": seconds}
+        if self.track_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            record["peak_mb"] = peak / 2 ** 20
+            # Alokasi tambahan di atas memori yang sudah terpakai saat tahapan dimulai
+            record["stage_peak_mb"] = (peak - base) / 2 ** 20
+        record.update(extra)
+        self.records.append(record)
+        print(f"  {name:<32} {seconds:10.4f} s" + (f"  {record['stage_peak_mb']:9.1f} MB" if self.track_memory else ""))
+
+
+def run_size(source, n_rows, workdir, max_svm_rows=DEFAULT_MAX_SVM_ROWS, single_calls=100, track_memory=True):
+    path = os.path.join(workdir, f"synthetic_{n_rows}.csv")
+    make_synthetic(source, n_rows).to_csv(path, index=False)
+    rec = StageRecorder(n_rows, track_memory)
+    print(f"\nJumlah baris: {n_rows}")
+
+    with rec.stage("load"):
+        df = pd.read_csv(path)
+    with rec.stage("describe"):
+        df.describe()
+    with rec.stage("corr"):
+        df.corr()
+    with rec.stage("duplicated"):
+        df.duplicated().sum()
+    with rec.stage("duplicated_hash"):
+        duplicated_in_batch(row_hashes(df)).sum()
+
+    features = df.drop(columns=[TARGET_COLUMN])
+    with rec.stage("train_test_split"):
+        X_train, X_test, y_train, y_test = train_test_split(features.to_numpy(dtype=np.float64),
+                                                            df[TARGET_COLUMN].to_numpy(),
+                                                            test_size=0.2, random_state=42)
+    with rec.stage("preprocessing"):
+        scaler = build_preprocessor()
+        X_train = scaler.fit_transform(X_train)
+        X_test = scaler.transform(X_test)
+
+    models = build_models(svm_mode="both")
+    for name, model in models.items():
+        if name == "SVM" and len(X_train) > max_svm_rows:
+            rec.records.append({"rows": n_rows, "stage": f"fit:{name}", "skipped": True})
+            print(f"  fit:{name:<28} dilewati (> {max_svm_rows} baris latih)")
+            continue
+        with rec.stage(f"fit:{name}"):
+            model.fit(X_train, y_train)
+        with rec.stage(f"predict:{name}"):
+            y_pred = model.predict(X_test)
+        with rec.stage(f"metrics:{name}"):
+            evaluate(y_test, y_pred)
+
+    # Prediksi satu pasien per panggilan, seperti blok "Data Pasien (Input Baru)"
+    best_model = models["Logistic Regression"]
+    raw = features.to_numpy()
+    with rec.stage("predict_single_row", calls=single_calls):
+        for i in range(single_calls):
+            best_model.predict_proba(scaler.transform(raw[i:i + 1]))
+    rec.records[-1]["seconds_per_row"] = rec.records[-1]["seconds"] / single_calls
+
+    with rec.stage("predict_batch"):
+        score_batch(raw, scaler, best_model)
+    rec.records[-1]["rows_per_second"] = n_rows / rec.records[-1]["seconds"]
+
+    os.remove(path)
+    return rec.records
+
+
+def import_time(statement, repeat=3):
+    """Waktu (detik, minimum dari beberapa percobaan) menjalankan `statement` di interpreter baru."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    return min(float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                     check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout)
+               for _ in range(repeat))
+
+
+def run_scorer(source, n_rows, workdir, artifact_dir=DEFAULT_ARTIFACT_DIR):
+    """Membandingkan jalur prediksi scikit-learn dengan `LinearScorer` pada `n_rows` baris."""
+    rec = StageRecorder(n_rows, track_memory=False)
+    print(f"\nScorer, jumlah baris: {n_rows}")
+    for name, statement in [("import:sklearn_path", "import pandas, sklearn.preprocessing, sklearn.linear_model"),
+                            ("import:numpy_scorer", "import scoring")]:
+        seconds = import_time(statement)
+        rec.records.append({"rows": n_rows, "stage": name, "seconds": seconds})
+        print(f"  {name:<32} {seconds:10.4f} s")
+
+    scaler = load_preprocessor(artifact_dir)
+    model = load_model(artifact_dir, LINEAR_MODEL_NAME)
+    scorer = load_scorer(artifact_dir)
+    X = make_synthetic(source, n_rows)[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    X32 = X.astype(np.float32)
+    path = os.path.join(workdir, "features_f32.npy")
+    np.save(path, X32)
+    X_mmap = np.load(path, mmap_mode="r")
+
+    with rec.stage("predict_proba:sklearn"):
+        reference = model.predict_proba(scaler.transform(X))[:, 1]
+    for name, data in [("float64", X), ("float32", X32), ("memmap_float32", X_mmap)]:
+        with rec.stage(f"predict_proba:scorer_{name}"):
+            probability = scorer.predict_proba(data)
+        rec.records[-1]["max_abs_diff"] = float(np.abs(probability - reference).max())
+    for r in rec.records:
+        if "seconds" in r and r["stage"].startswith("predict_proba"):
+            r["rows_per_second"] = n_rows / r["seconds"]
+            print(f"  {r['stage']:<32} {r['rows_per_second']:14,.0f} baris/detik"
+                  + (f"  selisih maks {r['max_abs_diff']:.2e}" if "max_abs_diff" in r else ""))
+    del X_mmap
+    os.remove(path)
+    return rec.records
+
+
+def _latency(fn, X, budget=1.0, max_repeat=100):
+    """Median waktu satu panggilan `fn(X)`; diulang hingga kira-kira `budget` detik."""
+    start = time.perf_counter()
+    fn(X)
+    first = time.perf_counter() - start
+    times = [first]
+    for _ in range(min(max_repeat, int(budget / max(first, 1e-6))) - 1):
+        start = time.perf_counter()
+        fn(X)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)), len(times)
+
+
+def _peak_mb(fn, X):
+    tracemalloc.start()
+    try:
+        fn(X)
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def run_forest(source, batch_sizes, artifact_dir=DEFAULT_ARTIFACT_DIR, n_threads=1):
+    """Membandingkan Random Forest scikit-learn dengan `ForestScorer` per ukuran batch."""
+    scaler = load_preprocessor(artifact_dir)
+    model = load_model(artifact_dir, FOREST_MODEL_NAME)
+    forest = load_forest(artifact_dir)
+    X = make_synthetic(source, max(batch_sizes))[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    model_bytes = {"sklearn": len(pickle.dumps(model)), "compiled": forest.nbytes}
+    print(f"\nUkuran model: scikit-learn (pickle) {model_bytes['sklearn'] / 2 ** 20:.2f} MB | "
+          f"terkompilasi {model_bytes['compiled'] / 2 ** 20:.2f} MB")
+
+    engines = {
+        "forest:sklearn": lambda data: model.predict_proba(scaler.transform(data)),
+        "forest:compiled": lambda data: forest.predict_proba_all(data, n_threads=n_threads),
+    }
+    records = []
+    for n_rows in batch_sizes:
+        batch = X[:n_rows]
+        reference = engines["forest:sklearn"](batch)
+        compiled = engines["forest:compiled"](batch)
+        identical = bool(np.array_equal(reference, compiled))
+        for name, fn in engines.items():
+            seconds, repeat = _latency(fn, batch)
+            records.append({"rows": n_rows, "stage": name, "seconds": seconds, "repeat": repeat,
+                            "rows_per_second": n_rows / seconds, "peak_mb": _peak_mb(fn, batch),
+                            "model_bytes": model_bytes[name.split(":")[1]], "identical": identical})
+        base, new = records[-2], records[-1]
+        print(f"  {n_rows:>9} baris  sklearn {base['seconds'] * 1000:10.2f} ms {base['peak_mb']:8.1f} MB"
+              f" | terkompilasi {new['seconds'] * 1000:10.2f} ms {new['peak_mb']:8.1f} MB"
+              f" | {base['seconds'] / new['seconds']:5.2f}x | identik: {identical}")
+    return records
+
+
+def compare_with_baseline(records, baseline_path):
+    """Mencetak rasio waktu terhadap hasil benchmark sebelumnya (>1 berarti lebih lambat)."""
+    with open(baseline_path) as f:
+        baseline = {(r["rows"], r["stage"]): r for r in json.load(f)["results"] if "seconds" in r}
+    print(f"\nPerbandingan dengan {baseline_path}:")
+    for r in records:
+        base = baseline.get((r["rows"], r["stage"]))
+        if base and "seconds" in r and base["seconds"] > 0:
+            print(f"  {r['rows']:>10} {r['stage']:<32} {r['seconds'] / base['seconds']:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline pada dataset sintetis.")
+    parser.add_argument("--data", default="dataset.csv", help="Dataset sumber untuk resampling")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="File JSON hasil benchmark sebelumnya untuk dibandingkan")
+    parser.add_argument("--max-svm-rows", type=int, default=DEFAULT_MAX_SVM_ROWS)
+    parser.add_argument("--no-memory", action="store_true", help="Nonaktifkan tracemalloc (waktu lebih akurat)")
+    parser.add_argument("--scorer", action="store_true", help="Benchmark LinearScorer vs jalur scikit-learn")
+    parser.add_argument("--forest", action="store_true", help="Benchmark ForestScorer vs Random Forest scikit-learn")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=DEFAULT_BATCH_SIZES,
+                        help="Ukuran batch untuk mode --forest")
+    parser.add_argument("--threads", type=int, default=1, help="Thread ForestScorer untuk mode --forest")
+    parser.add_argument("--artifact", default=DEFAULT_ARTIFACT_DIR, help="Artefak untuk mode --scorer/--forest")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.data)
+    track_memory = not args.no_memory and not args.scorer and not args.forest
+    if track_memory:
+        tracemalloc.start()
+
+    records = []
+    if args.forest:
+        records += run_forest(source, args.batch_sizes, args.artifact, args.threads)
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_rows in ([] if args.forest else args.sizes):
+            if args.scorer:
+                records += run_scorer(source, n_rows, workdir, args.artifact)
+            else:
+                records += run_size(source, n_rows, workdir, args.max_svm_rows, track_memory=track_memory)
+
+    report = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "sklearn": sklearn.__version__,
+            "memory_tracked": track_memory,
+            "max_rss_mb": max_rss_mb(),
+        },
+        "results": records,
+    }
+    if args.baseline:
+        compare_with_baseline(records, args.baseline)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil benchmark disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
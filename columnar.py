@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Cache data mentah dalam format kolumnar biner (.npy) yang dibuka sebagai memmap.
+
+Parsing `dataset.csv` dilakukan sekali; hasilnya disimpan di
+`cache_dir/<hash path>/<sha256 isi>/`:
+- `features.npy`: fitur mentah yang sudah dibersihkan (float64, NaN untuk nilai kosong)
+  dengan urutan `FEATURE_COLUMNS`, disimpan Fortran-order sehingga setiap kolom
+  bersebelahan di file dan `features[:, j]` adalah view tanpa salinan;
+- `target.npy`: label `Outcome` (int64);
+- `split-<test_size>-<random_state>-{train,test}.npy`: indeks pembagian data latih/uji,
+  dibuat saat pertama kali diminta;
+- `meta.json`: fingerprint file CSV sumber (sama dengan `artifacts.dataset_fingerprint`).
+
+Direktori data diberi nama dari SHA-256 isi CSV dan tidak pernah diubah setelah
+dipindahkan ke tempatnya. `cache_dir/<hash path>/current.json` menunjuk ke versi yang
+berlaku beserta ukuran dan mtime file CSV, dan hanya diganti secara atomik, sehingga
+pembaca tidak pernah melihat direktori yang sedang ditulis atau dihapus.
+
+Run berikutnya hanya mencocokkan ukuran dan mtime file CSV (tanpa membaca isinya);
+jika berbeda, SHA-256 dihitung ulang dan cache dibangun ulang bila isinya berubah.
+Semua array dibuka dengan `mmap_mode="r"` sehingga data dibagi lewat page cache OS.
+
+Contoh penggunaan:
+    python columnar.py --data dataset.csv
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+from artifacts import dataset_fingerprint
+from schema import FEATURE_COLUMNS, TARGET_COLUMN
+
+COLUMNAR_VERSION = 2
+DEFAULT_DATA_CACHE_DIR = os.path.join(".cache", "columnar")
+
+
+def _file_stat(path):
+    st = os.stat(path)
+    return {"bytes": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _save_atomic(path, array):
+    tmp = f"{path}.tmp-{os.getpid()}.npy"
+    np.save(tmp, array)
+    os.replace(tmp, path)
+
+
+def _write_json_atomic(path, data):
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+class _HashingReader:
+    """File biner yang menghitung SHA-256 dan jumlah byte dari semua yang dibaca."""
+
+    def __init__(self, f):
+        self._f = f
+        self.digest = hashlib.sha256()
+        self.bytes = 0
+
+    def read(self, size=-1):
+        block = self._f.read(size)
+        self.digest.update(block)
+        self.bytes += len(block)
+        return block
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def readline(self, size=-1):
+        line = self._f.readline(size)
+        self.digest.update(line)
+        self.bytes += len(line)
+        return line
+
+
+class ColumnarData:
+    """Data mentah dari cache kolumnar: `features`, `target` dan `fingerprint` file sumber."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.fingerprint = self.meta["fingerprint"]
+        self.features = np.load(os.path.join(directory, "features.npy"), mmap_mode="r")
+        self.target = np.load(os.path.join(directory, "target.npy"), mmap_mode="r")
+
+    def __len__(self):
+        return len(self.target)
+
+    def frame(self):
+        """DataFrame `ALL_COLUMNS` yang kolomnya berupa view memmap (tanpa salinan data)."""
+        import pandas as pd
+
+        columns = {col: self.features[:, j] for j, col in enumerate(FEATURE_COLUMNS)}
+        columns[TARGET_COLUMN] = self.target
+        return pd.DataFrame(columns, copy=False)
+
+    def split_indices(self, test_size=0.2, random_state=42):
+        """`(train_index, test_index)` sama dengan `train_test_split` pada urutan baris yang sama."""
+        paths = [os.path.join(self.directory, f"split-{test_size}-{random_state}-{part}.npy")
+                 for part in ("train", "test")]
+        if not all(os.path.exists(path) for path in paths):
+            from sklearn.model_selection import train_test_split
+
+            indices = train_test_split(np.arange(len(self)), test_size=test_size, random_state=random_state)
+            for path, index in zip(paths, indices):
+                _save_atomic(path, index)
+        return tuple(np.load(path, mmap_mode="r") for path in paths)
+
+
+def build_cache(path, root):
+    """Parsing CSV sekali (SHA-256 dihitung pada lintasan baca yang sama) lalu menulis data ke `root`.
+
+    Mengembalikan `(nama versi, fingerprint)`. Jika versi dengan isi yang sama sudah
+    ada (misalnya ditulis proses lain), direktori tersebut dipakai apa adanya.
+    """
+    from streaming import load_dataset
+
+    with open(path, "rb") as f:
+        reader = _HashingReader(f)
+        df = load_dataset(reader)
+        # Sisa file yang tidak dibutuhkan parser tetap masuk ke hash
+        while reader.read(1 << 20):
+            pass
+    fingerprint = {"sha256": reader.digest.hexdigest(), "bytes": reader.bytes, "source": os.path.basename(path)}
+    name = fingerprint["sha256"][:32]
+    directory = os.path.join(root, name)
+    if os.path.exists(os.path.join(directory, "meta.json")):
+        return name, fingerprint
+
+    tmp = os.path.join(root, f".tmp-{name}-{os.getpid()}")
+    os.makedirs(tmp, exist_ok=True)
+    np.save(os.path.join(tmp, "features.npy"),
+            np.asfortranarray(df[FEATURE_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)))
+    np.save(os.path.join(tmp, "target.npy"), df[TARGET_COLUMN].to_numpy(dtype=np.int64))
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump({"version": COLUMNAR_VERSION, "fingerprint": fingerprint, "rows": len(df),
+                   "columns": FEATURE_COLUMNS}, f, indent=2)
+    try:
+        os.replace(tmp, directory)
+    except OSError:
+        # Proses lain sudah menulis versi dengan isi yang sama lebih dulu
+        shutil.rmtree(tmp, ignore_errors=True)
+    return name, fingerprint
+
+
+def _current(root, path):
+    """Nama versi yang berlaku untuk file CSV `path`, atau None jika cache harus dibangun.
+
+    Ukuran + mtime yang cocok cukup; jika mtime berubah tetapi SHA-256 isinya sama,
+    penunjuk diperbarui tanpa membangun ulang.
+    """
+    pointer_path = os.path.join(root, "current.json")
+    if not os.path.exists(pointer_path):
+        return None
+    with open(pointer_path) as f:
+        pointer = json.load(f)
+    directory = os.path.join(root, pointer.get("data", ""))
+    if (pointer.get("version") != COLUMNAR_VERSION or pointer.get("columns") != FEATURE_COLUMNS
+            or not os.path.exists(os.path.join(directory, "meta.json"))):
+        return None
+    stat = _file_stat(path)
+    if pointer["stat"] == stat:
+        return pointer["data"]
+    if stat["bytes"] != pointer["stat"]["bytes"] or dataset_fingerprint(path)["sha256"][:32] != pointer["data"]:
+        return None
+    # Isi sama, hanya mtime yang berubah (misalnya file disalin ulang)
+    _write_json_atomic(pointer_path, {**pointer, "stat": stat})
+    return pointer["data"]
+
+
+def open_data(path, cache_dir=DEFAULT_DATA_CACHE_DIR):
+    """Membuka cache kolumnar untuk file CSV `path`, membangunnya lebih dulu jika perlu.
+
+    Mengembalikan `(ColumnarData, hit)`.
+    """
+    root = os.path.join(cache_dir, hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:32])
+    name = _current(root, path)
+    hit = name is not None
+    if not hit:
+        os.makedirs(root, exist_ok=True)
+        stat = _file_stat(path)
+        name, _ = build_cache(path, root)
+        pointer_path = os.path.join(root, "current.json")
+        previous = None
+        if os.path.exists(pointer_path):
+            with open(pointer_path) as f:
+                previous = json.load(f).get("data")
+        _write_json_atomic(pointer_path, {"version": COLUMNAR_VERSION, "columns": FEATURE_COLUMNS,
+                                          "data": name, "stat": stat})
+        # Versi lama dihapus kecuali yang baru saja diganti, yang mungkin masih dibuka proses lain
+        for entry in os.listdir(root):
+            if entry not in (name, previous, "current.json") and not entry.startswith("."):
+                shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    return ColumnarData(os.path.join(root, name)), hit
+
+
+def _load_csv(path):
+    from streaming import load_dataset
+
+    df = load_dataset(path)
+    return (df[FEATURE_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan), df[TARGET_COLUMN].to_numpy(dtype=np.int64),
+            dataset_fingerprint(path))
+
+
+def _load_columnar(path, cache_dir):
+    data, _ = open_data(path, cache_dir)
+    return data.features, data.target, data.fingerprint
+
+
+def _measure(load, *args):
+    """Waktu muat, lalu puncak alokasi memori (tracemalloc) pada pemanggilan terpisah.
+
+    Halaman memmap adalah page cache milik OS, bukan alokasi heap proses, sehingga
+    tidak terhitung; semua nilai disentuh agar halaman tersebut benar-benar dibaca.
+    """
+    import tracemalloc
+
+    def run():
+        X, y, fingerprint = load(*args)
+        checksum = sum(float(np.nansum(X[:, j])) for j in range(X.shape[1])) + int(y.sum())
+        return checksum, fingerprint["sha256"]
+
+    start = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bangun cache kolumnar dan bandingkan dengan membaca CSV.")
+    parser.add_argument("--data", default="dataset.csv")
+    parser.add_argument("--cache-dir", default=DEFAULT_DATA_CACHE_DIR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data, hit = open_data(args.data, args.cache_dir)
+    print(f"Cache kolumnar: {data.directory} ({'sudah ada' if hit else 'dibangun'}, "
+          f"{time.perf_counter() - start:.2f} detik) | Jumlah baris: {len(data)}")
+
+    csv_result, csv_seconds, csv_peak = _measure(_load_csv, args.data)
+    col_result, col_seconds, col_peak = _measure(_load_columnar, args.data, args.cache_dir)
+    if csv_result != col_result:
+        raise RuntimeError("Isi cache kolumnar berbeda dengan hasil membaca CSV.")
+    print(f"  CSV       waktu muat {csv_seconds:8.3f} detik | puncak memori {csv_peak:8.1f} MB")
+    print(f"  Kolumnar  waktu muat {col_seconds:8.3f} detik | puncak memori {col_peak:8.1f} MB")
+    print(f"Percepatan muat: {csv_seconds / col_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""Fixture bersama untuk tests/; file ini juga menjadikan root repo bagian dari sys.path pytest."""
+
+import os
+
+import pytest
+
+from streaming import load_dataset
+
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dataset.csv")
+
+
+@pytest.fixture(scope="session")
+def dataset():
+    """`dataset.csv` bawaan repo (dibaca sekali per sesi; jangan diubah di dalam test)."""
+    return load_dataset(DATASET)
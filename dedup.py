@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""Deteksi baris duplikat berbasis hash, inkremental lintas batch data.
+
+Setiap baris (9 kolom `ALL_COLUMNS`) diubah ke baris biner lebar tetap: nilai
+dikonversi ke tipe `DTYPES` lalu ke float64 kanonik (NaN seragam, -0.0 menjadi 0.0),
+sehingga satu baris = 9 kata uint64. Hash 64-bit dihitung per kolom secara
+tervektorisasi untuk seluruh chunk.
+
+Hash baris yang pernah dilihat disimpan di `HashIndex`: beberapa run array uint64
+terurut di disk (seperti level pada LSM-tree). Pengecekan chunk baru cukup
+`searchsorted` ke setiap run tanpa membaca ulang data lama; run kecil digabung
+bertahap sehingga jumlah run tetap logaritmik.
+
+Duplikat dilaporkan dua jenis, yang jika dijumlahkan sama dengan `df.duplicated()`
+pada gabungan semua batch:
+- dalam batch: sama dengan baris sebelumnya pada batch yang sama;
+- lintas batch: sudah ada di batch sebelumnya.
+
+Contoh penggunaan:
+    python dedup.py batch_hari_ini.csv --index artifacts/dedup_index
+    python dedup.py batch_hari_ini.csv --index artifacts/dedup_index --output batch_bersih.csv
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import stage
+from schema import ALL_COLUMNS, DTYPES
+from streaming import DEFAULT_CHUNK_SIZE, read_chunks
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_DIR = os.path.join("artifacts", "dedup_index")
+# Run terakhir digabung dengan run sebelumnya jika ukurannya setidaknya 1/MERGE_FACTOR-nya
+MERGE_FACTOR = 4
+
+_CANONICAL_NAN = np.float64(np.nan).view(np.uint64)
+_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(x):
+    # Finalizer splitmix64; operasi uint64 NumPy berputar (modulo 2**64) tanpa overflow error
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def row_words(df, columns=ALL_COLUMNS):
+    """Baris biner lebar tetap: array uint64 `(n_baris, n_kolom)` dari nilai float64 kanonik."""
+    values = np.empty((len(df), len(columns)), dtype=np.float64)
+    for j, col in enumerate(columns):
+        values[:, j] = df[col].astype(DTYPES[col]).to_numpy(dtype=np.float64, na_value=np.nan)
+    values += 0.0  # -0.0 menjadi 0.0
+    words = values.view(np.uint64)
+    words[np.isnan(values)] = _CANONICAL_NAN
+    return words
+
+
+def row_hashes(df, columns=ALL_COLUMNS):
+    """Hash 64-bit setiap baris `df`, dihitung kolom demi kolom untuk seluruh baris sekaligus."""
+    words = row_words(df, columns)
+    h = np.full(len(words), len(columns), dtype=np.uint64)
+    for j in range(words.shape[1]):
+        h = _mix(h * _MULTIPLIER + words[:, j])
+    return h
+
+
+def duplicated_in_batch(hashes):
+    """Mask baris yang hash-nya sudah muncul sebelumnya di array yang sama (`keep='first'`)."""
+    _, first = np.unique(hashes, return_index=True)
+    mask = np.ones(len(hashes), dtype=bool)
+    mask[first] = False
+    return mask
+
+
+class HashIndex:
+    """Himpunan hash uint64 persisten dalam beberapa run terurut yang saling lepas."""
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.runs = []
+        self.rows_seen = 0
+        self._next_run = 0
+        if directory and os.path.exists(os.path.join(directory, "index.json")):
+            with open(os.path.join(directory, "index.json")) as f:
+                meta = json.load(f)
+            if meta.get("version") != INDEX_VERSION:
+                raise ValueError(f"Versi index dedup {meta.get('version')} tidak didukung (diharapkan {INDEX_VERSION}).")
+            self.runs = [np.load(os.path.join(directory, name), mmap_mode="r") for name in meta["runs"]]
+            self.rows_seen = meta["rows_seen"]
+            self._next_run = meta["next_run"]
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    @property
+    def nbytes(self):
+        return sum(run.nbytes for run in self.runs)
+
+    def contains(self, hashes):
+        """Mask untuk setiap hash yang sudah ada di index."""
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            pos = np.searchsorted(run, hashes)
+            pos[pos == len(run)] = 0
+            found |= run[pos] == hashes
+        return found
+
+    def add(self, hashes):
+        """Menambah hash yang belum ada sebagai run baru, lalu menggabung run yang kecil."""
+        new = np.unique(hashes)
+        new = new[~self.contains(new)]
+        if len(new):
+            self.runs.append(new)
+        while len(self.runs) > 1 and len(self.runs[-2]) <= MERGE_FACTOR * len(self.runs[-1]):
+            last = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]))
+        return len(new)
+
+    def save(self):
+        """Menulis run ke `directory`; manifest diganti secara atomik lalu file lama dihapus."""
+        os.makedirs(self.directory, exist_ok=True)
+        names = []
+        for i, run in enumerate(self.runs):
+            if isinstance(run, np.memmap):
+                names.append(os.path.basename(run.filename))
+                continue
+            name = f"run-{self._next_run:06d}.npy"
+            self._next_run += 1
+            np.save(os.path.join(self.directory, name), run)
+            self.runs[i] = np.load(os.path.join(self.directory, name), mmap_mode="r")
+            names.append(name)
+
+        tmp = os.path.join(self.directory, f"index.json.tmp-{os.getpid()}")
+        with open(tmp, "w") as f:
+            json.dump({"version": INDEX_VERSION, "runs": names, "rows_seen": self.rows_seen,
+                       "next_run": self._next_run}, f)
+        os.replace(tmp, os.path.join(self.directory, "index.json"))
+        for name in os.listdir(self.directory):
+            if name.startswith("run-") and name not in names:
+                os.remove(os.path.join(self.directory, name))
+
+
+class Deduplicator:
+    """Memeriksa chunk data terhadap dirinya sendiri dan terhadap semua batch sebelumnya."""
+
+    def __init__(self, index_dir=None):
+        self.index = HashIndex(index_dir)
+        self.batch = HashIndex()
+        self.rows = 0
+        self.in_batch = 0
+        self.cross_batch = 0
+
+    def check(self, chunk):
+        """Mengembalikan `(in_batch, cross_batch)`: mask duplikat untuk setiap baris `chunk`.
+
+        Chunk yang diperiksa sebelum `commit()` dianggap satu batch, sehingga duplikat
+        antar-chunk dalam file yang sama tetap terhitung "dalam batch".
+        """
+        hashes = row_hashes(chunk)
+        cross = self.index.contains(hashes)
+        in_batch = (duplicated_in_batch(hashes) | self.batch.contains(hashes)) & ~cross
+        self.batch.add(hashes)
+        self.rows += len(hashes)
+        self.in_batch += int(in_batch.sum())
+        self.cross_batch += int(cross.sum())
+        return in_batch, cross
+
+    def commit(self):
+        """Memasukkan hash batch saat ini ke index lalu menyimpannya jika index punya direktori."""
+        for run in self.batch.runs:
+            self.index.add(run)
+        self.index.rows_seen += self.rows
+        self.batch = HashIndex()
+        self.rows = self.in_batch = self.cross_batch = 0
+        if self.index.directory:
+            self.index.save()
+
+    @property
+    def duplicates(self):
+        return self.in_batch + self.cross_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deteksi duplikat inkremental berbasis hash baris.")
+    parser.add_argument("path", help="File CSV batch baru (9 kolom termasuk Outcome)")
+    parser.add_argument("--index", default=DEFAULT_INDEX_DIR, help="Direktori index hash batch sebelumnya")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", help="Tulis hanya baris yang belum pernah dilihat ke CSV ini")
+    parser.add_argument("--show", action="store_true", help="Tampilkan baris duplikat")
+    parser.add_argument("--dry-run", action="store_true", help="Periksa saja tanpa memperbarui index")
+    args = parser.parse_args()
+
+    dedup = Deduplicator(args.index)
+    previous = dedup.index.rows_seen
+    duplicates = []
+    start = time.perf_counter()
+    with stage("dedup", path=args.path, indexed=previous):
+        for i, chunk in enumerate(read_chunks(args.path, args.chunk_size)):
+            in_batch, cross = dedup.check(chunk)
+            mask = in_batch | cross
+            if args.show:
+                duplicates.append(chunk[mask])
+            if args.output:
+                chunk[~mask].to_csv(args.output, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    elapsed = time.perf_counter() - start
+
+    print(f"Jumlah baris: {dedup.rows} | Baris di index sebelumnya: {previous} | Waktu: {elapsed:.2f} detik")
+    print(f"Jumlah baris duplikat: {dedup.duplicates} "
+          f"(dalam batch: {dedup.in_batch}, lintas batch: {dedup.cross_batch})")
+    if args.show:
+        print("Baris duplikat:")
+        print(pd.concat(duplicates) if duplicates else pd.DataFrame(columns=ALL_COLUMNS))
+    if args.output:
+        print(f"Baris baru disimpan di: {args.output} ({dedup.rows - dedup.duplicates} baris)")
+    if not args.dry_run:
+        dedup.commit()
+        print(f"Index disimpan di: {args.index} ({len(dedup.index)} hash, {dedup.index.nbytes / 2 ** 20:.2f} MB)")
+
+
+if __name__ == "__main__":
+    main()
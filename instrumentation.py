@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Pencatatan waktu, CPU, memori dan jumlah baris per tahapan pipeline.
+
+Nonaktif secara default; `stage()` hanya mengembalikan objek kosong sehingga
+overhead-nya dapat diabaikan. Aktifkan lewat environment variable atau `configure()`:
+
+- `PIPELINE_TRACE`: path file JSON lines (atau `-` untuk stderr).
+- `PIPELINE_TRACE_MEMORY=1`: puncak memori per tahapan dengan tracemalloc (lebih lambat).
+- `PIPELINE_PROFILE_STAGE`: nama tahapan yang diprofilkan dengan cProfile.
+- `PIPELINE_PROFILE_DIR`: direktori output file `.prof` (default: direktori kerja).
+
+Contoh:
+    with stage("load") as s:
+        df = load_data(path)
+        s.rows = len(df)
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+_config = {
+    "trace": os.environ.get("PIPELINE_TRACE"),
+    "memory": os.environ.get("PIPELINE_TRACE_MEMORY") == "1",
+    "profile_stage": os.environ.get("PIPELINE_PROFILE_STAGE"),
+    "profile_dir": os.environ.get("PIPELINE_PROFILE_DIR", "."),
+}
+_stream = None
+_stream_pid = None
+
+
+def configure(trace=None, memory=None, profile_stage=None, profile_dir=None):
+    """Mengaktifkan atau mengubah pengaturan instrumentasi dari kode (misalnya flag CLI).
+
+    Pengaturan juga diteruskan ke environment agar ikut terbawa ke proses worker.
+    """
+    global _stream
+    for key, value, env in [("trace", trace, "PIPELINE_TRACE"),
+                            ("profile_stage", profile_stage, "PIPELINE_PROFILE_STAGE"),
+                            ("profile_dir", profile_dir, "PIPELINE_PROFILE_DIR")]:
+        if value is not None:
+            _config[key] = value
+            os.environ[env] = value
+    if memory is not None:
+        _config["memory"] = memory
+        os.environ["PIPELINE_TRACE_MEMORY"] = "1" if memory else "0"
+    if _stream not in (None, sys.stderr):
+        _stream.close()
+    _stream = None
+
+
+def enabled():
+    return bool(_config["trace"] or _config["profile_stage"])
+
+
+class _NullStage:
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def max_rss_mb():
+    """Puncak RSS proses ini dalam MB, atau None jika tidak tersedia (modul `resource` tidak ada di Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS melaporkan ru_maxrss dalam byte, Linux dan BSD lain dalam KB
+    return rss / 2 ** 20 if sys.platform == "darwin" else rss / 1024
+
+
+def _emit(record):
+    global _stream, _stream_pid
+    if not _config["trace"]:
+        return
+    if _stream is None or _stream_pid != os.getpid():
+        # File dibuka ulang di setiap proses; mode append agar baris dari beberapa worker tidak saling menimpa
+        _stream = sys.stderr if _config["trace"] == "-" else open(_config["trace"], "a", buffering=1)
+        _stream_pid = os.getpid()
+    _stream.write(json.dumps(record) + "\n")
+    _stream.flush()
+
+
+class _Stage:
+    def __init__(self, name, rows, fields):
+        self.name = name
+        self.rows = rows
+        self.fields = fields
+        self._profiler = None
+
+    def __enter__(self):
+        if _config["memory"]:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._mem_base = tracemalloc.get_traced_memory()[0]
+        if _config["profile_stage"] == self.name:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        rss = max_rss_mb()
+        record = {
+            "stage": self.name,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "rows": self.rows,
+            "max_rss_mb": None if rss is None else round(rss, 1),
+            "pid": os.getpid(),
+            "ts": time.time(),
+        }
+        if _config["memory"]:
+            import tracemalloc
+            record["peak_mb"] = round((tracemalloc.get_traced_memory()[1] - self._mem_base) / 2 ** 20, 3)
+        if self._profiler is not None:
+            self._profiler.disable()
+            os.makedirs(_config["profile_dir"], exist_ok=True)
+            filename = re.sub(r"[^\w.-]+", "_", self.name) + ".prof"
+            record["profile"] = os.path.join(_config["profile_dir"], filename)
+            self._profiler.dump_stats(record["profile"])
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        record.update(self.fields)
+        _emit(record)
+        return False
+
+
+def stage(name, rows=None, **fields):
+    """Context manager untuk satu tahapan; atribut `rows` dapat diisi di dalam blok."""
+    if not enabled():
+        return _NULL_STAGE
+    return _Stage(name, rows, fields)
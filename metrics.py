@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Metrik evaluasi klasifikasi biner berbasis NumPy.
+
+- `confusion_counts` menghitung confusion matrix dengan satu `np.bincount`, lalu
+  `scores_from_confusion` menurunkan accuracy, precision, recall dan F1 darinya
+  (hasilnya sama dengan fungsi `sklearn.metrics` masing-masing).
+- `ThresholdCurve` menghitung TP/FP untuk semua threshold sekaligus dengan satu
+  pengurutan skor dan satu cumsum, sehingga kurva ROC/PR dan tabel threshold
+  murah dihitung bahkan untuk jutaan baris validasi.
+- `bootstrap_ci` menarik semua resample sebagai satu matriks indeks, lalu menghitung
+  confusion matrix setiap resample dan setiap model sekaligus (bincount + perkalian
+  matriks) untuk selang kepercayaan metrik dan selisih antar-model.
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+
+def confusion_counts(y_true, y_pred):
+    """Confusion matrix 2x2 `[[TN, FP], [FN, TP]]` untuk label 0/1."""
+    y_true = np.asarray(y_true, dtype=np.intp)
+    y_pred = np.asarray(y_pred, dtype=np.intp)
+    return np.bincount(2 * y_true + y_pred, minlength=4).reshape(2, 2)
+
+
+def _divide(numerator, denominator):
+    # Sama dengan zero_division default scikit-learn: 0 jika penyebutnya 0
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), 0.0)
+
+
+def scores_from_counts(counts):
+    """Accuracy, precision, recall dan F1 dari array hitungan `[..., (TN, FP, FN, TP)]`.
+
+    Bekerja untuk bentuk apa pun; mengembalikan array `[..., 4]`.
+    """
+    counts = np.asarray(counts)
+    tn, fp, fn, tp = (counts[..., i] for i in range(4))
+    return np.stack([
+        _divide(tp + tn, tn + fp + fn + tp),
+        _divide(tp, tp + fp),
+        _divide(tp, tp + fn),
+        _divide(2 * tp, 2 * tp + fp + fn),
+    ], axis=-1)
+
+
+def scores_from_confusion(cm):
+    """`[accuracy, precision, recall, f1]` dari confusion matrix 2x2."""
+    return scores_from_counts(np.asarray(cm).ravel()).tolist()
+
+
+def positive_scores(model, X):
+    """Skor kontinu kelas positif: `predict_proba[:, 1]` jika ada, selain itu `decision_function`."""
+    if hasattr(model, "predict_proba"):
+        return model.predict_proba(X)[:, 1]
+    return model.decision_function(X)
+
+
+def predict_with_scores(model, X):
+    """`(y_pred, skor)` dari satu kali inferensi, dengan skor seperti `positive_scores`.
+
+    Kelas diturunkan dari skor dengan aturan yang sama seperti `predict` scikit-learn
+    untuk kasus biner: argmax probabilitas, atau `decision_function > 0`.
+    """
+    if hasattr(model, "predict_proba"):
+        proba = model.predict_proba(X)
+        return model.classes_.take(np.argmax(proba, axis=1)), proba[:, 1]
+    scores = model.decision_function(X)
+    return model.classes_.take((scores > 0).astype(np.intp)), scores
+
+
+class ThresholdCurve:
+    """TP/FP kumulatif untuk setiap threshold berbeda pada skor prediksi.
+
+    Baris ke-i berarti "prediksi positif jika skor >= thresholds[i]"; threshold
+    diurutkan menurun sehingga recall naik sepanjang array.
+    """
+
+    def __init__(self, y_true, scores):
+        y_true = np.asarray(y_true)
+        scores = np.asarray(scores, dtype=np.float64)
+        order = np.argsort(scores, kind="stable")[::-1]
+        scores = scores[order]
+        # Indeks terakhir dari setiap kelompok skor yang sama (kosong jika tidak ada baris)
+        last = np.flatnonzero(np.diff(scores))
+        if len(scores):
+            last = np.r_[last, len(scores) - 1]
+        self.thresholds = scores[last]
+        self.tp = np.cumsum(y_true[order], dtype=np.int64)[last]
+        self.fp = last + 1 - self.tp
+        self.positives = int(self.tp[-1]) if len(self.tp) else 0
+        self.negatives = len(scores) - self.positives
+
+    @property
+    def recall(self):
+        return _divide(self.tp, self.positives)
+
+    @property
+    def precision(self):
+        return _divide(self.tp, self.tp + self.fp)
+
+    @property
+    def fpr(self):
+        return _divide(self.fp, self.negatives)
+
+    def roc(self):
+        """`(fpr, tpr, thresholds)` dengan titik awal (0, 0) seperti `roc_curve`."""
+        return (np.r_[0.0, self.fpr], np.r_[0.0, self.recall], np.r_[np.inf, self.thresholds])
+
+    def pr(self):
+        """`(precision, recall, thresholds)` dengan urutan threshold menurun."""
+        return self.precision, self.recall, self.thresholds
+
+    def roc_auc(self):
+        """Luas di bawah kurva ROC; NaN jika data tidak memuat kedua kelas (termasuk kurva kosong)."""
+        if not self.positives or not self.negatives:
+            return float("nan")
+        fpr, tpr, _ = self.roc()
+        return float(np.trapezoid(tpr, fpr))
+
+    def average_precision(self):
+        """Sama dengan `average_precision_score`: sum((R_i - R_{i-1}) * P_i)."""
+        recall = self.recall
+        return float(np.sum(np.diff(np.r_[0.0, recall]) * self.precision))
+
+    def table(self):
+        """Tabel threshold sebagai dict kolom: threshold, TP, FP, FN, TN dan metrik turunannya."""
+        fn = self.positives - self.tp
+        tn = self.negatives - self.fp
+        total = self.positives + self.negatives
+        return {
+            "Threshold": self.thresholds,
+            "TP": self.tp,
+            "FP": self.fp,
+            "FN": fn,
+            "TN": tn,
+            "Accuracy": _divide(self.tp + tn, total),
+            "Precision": self.precision,
+            "Recall": self.recall,
+            "F1-Score": _divide(2 * self.tp, 2 * self.tp + self.fp + fn),
+            "FPR": self.fpr,
+        }
+
+    def operating_point(self, min_recall):
+        """Baris tabel dengan threshold tertinggi yang mencapai recall minimal `min_recall`.
+
+        `min_recall` harus di antara 0 dan 1. ValueError jika tidak ada threshold yang
+        mencapainya (kurva kosong, atau recall > 0 diminta tanpa satu pun kelas positif).
+        """
+        if not 0 <= min_recall <= 1:
+            raise ValueError(f"min_recall harus di antara 0 dan 1, bukan {min_recall}")
+        i = int(np.searchsorted(self.recall, min_recall, side="left"))
+        if i == len(self.thresholds):
+            raise ValueError(f"Tidak ada threshold dengan recall >= {min_recall} "
+                             f"({self.positives} positif dari {self.positives + self.negatives} baris)")
+        return {key: column[i].item() for key, column in self.table().items()}
+
+
+def bootstrap_indices(n_rows, n_resamples=1000, random_state=42):
+    """Matriks indeks resample `(n_resamples, n_rows)`, diambil dengan pengembalian."""
+    rng = np.random.default_rng(random_state)
+    dtype = np.int32 if n_rows < np.iinfo(np.int32).max else np.int64
+    return rng.integers(0, n_rows, size=(n_resamples, n_rows), dtype=dtype)
+
+
+def bootstrap_counts(y_true, y_preds, indices):
+    """Hitungan `(TN, FP, FN, TP)` untuk setiap model dan resample, bentuk `(n_model, n_resample, 4)`.
+
+    `y_preds` berbentuk `(n_model, n_baris)`. Satu `np.bincount` mengubah matriks indeks
+    menjadi bobot kemunculan setiap baris per resample, lalu satu perkalian matriks
+    dengan one-hot sel confusion matrix menghasilkan hitungan semua model sekaligus.
+    """
+    y_true = np.asarray(y_true, dtype=np.intp)
+    y_preds = np.asarray(y_preds, dtype=np.intp)
+    n_resamples, n_rows = indices.shape
+    offsets = np.arange(n_resamples, dtype=np.intp)[:, np.newaxis] * n_rows
+    weights = np.bincount((indices + offsets).ravel(), minlength=n_resamples * n_rows).reshape(n_resamples, n_rows)
+    cells = 2 * y_true + y_preds
+    one_hot = (cells[:, :, np.newaxis] == np.arange(4)).transpose(1, 0, 2).reshape(n_rows, -1)
+    # Hitungan bulat tetap eksak dalam float64 selama jumlah baris < 2**53
+    counts = weights.astype(np.float64) @ one_hot.astype(np.float64)
+    return counts.reshape(n_resamples, len(y_preds), 4).transpose(1, 0, 2).astype(np.int64)
+
+
+def bootstrap_ci(y_true, predictions, n_resamples=1000, confidence=0.95, random_state=42):
+    """Selang kepercayaan persentil untuk metrik setiap model dan selisih setiap pasangan model.
+
+    `predictions` adalah dict `{nama_model: y_pred}` pada baris yang sama. Semua model
+    memakai resample yang sama sehingga selisihnya berpasangan. Mengembalikan
+    `(intervals, differences)`: dict `{nama: array (4, 3)}` dan `{(a, b): array (4, 3)}`
+    dengan baris mengikuti urutan accuracy/precision/recall/F1 dan kolom
+    (estimasi, batas bawah, batas atas).
+    """
+    names = list(predictions)
+    y_preds = np.stack([np.asarray(predictions[name]) for name in names])
+    indices = bootstrap_indices(len(y_true), n_resamples, random_state)
+    scores = scores_from_counts(bootstrap_counts(y_true, y_preds, indices))
+    point = np.array([scores_from_confusion(confusion_counts(y_true, y_pred)) for y_pred in y_preds])
+    quantiles = [(1 - confidence) / 2 * 100, (1 + confidence) / 2 * 100]
+
+    def interval(estimate, samples):
+        low, high = np.percentile(samples, quantiles, axis=0)
+        return np.column_stack([estimate, low, high])
+
+    intervals = {name: interval(point[m], scores[m]) for m, name in enumerate(names)}
+    differences = {(names[a], names[b]): interval(point[a] - point[b], scores[a] - scores[b])
+                   for a, b in combinations(range(len(names)), 2)}
+    return intervals, differences
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Pelatihan inkremental untuk batch pasien baru berlabel.
+
+Statistik normalisasi diperbarui dengan mean/varians berjalan (`StandardScaler.partial_fit`)
+dan model linear setara Logistic Regression (`SGDClassifier` dengan loss logistik
+dan averaging) diperbarui dengan beberapa epoch `partial_fit` atas batch baru saja. Data lama tidak perlu dibaca ulang;
+state disimpan sebagai checkpoint setelah setiap batch.
+
+Contoh penggunaan:
+    python online.py update batch_hari_ini.csv --checkpoint artifacts/online.joblib
+    python online.py compare --data dataset.csv --batches 8
+"""
+
+import argparse
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from pipeline import METRIC_NAMES, evaluate, load_data
+from schema import FEATURE_COLUMNS, TARGET_COLUMN
+from streaming import read_chunks
+
+CHECKPOINT_VERSION = 2
+DEFAULT_CHECKPOINT = os.path.join("artifacts", "online.joblib")
+CLASSES = np.array([0, 1])
+
+
+class OnlineModel:
+    """Scaler berjalan + klasifier linear logistik yang diperbarui per batch."""
+
+    def __init__(self, alpha=1e-4, epochs=5, random_state=42):
+        self.scaler = StandardScaler()
+        self.model = SGDClassifier(loss="log_loss", alpha=alpha, learning_rate="optimal", average=True,
+                                   random_state=random_state)
+        self.epochs = epochs
+        self.random_state = random_state
+        self.n_updates = 0
+
+    @property
+    def n_seen(self):
+        return int(getattr(self.scaler, "n_samples_seen_", 0))
+
+    def partial_fit(self, X, y):
+        """Memperbarui scaler dan model dengan satu batch data baru (fitur mentah)."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y)
+        self.scaler.partial_fit(X)
+        X_scaled = self.scaler.transform(X)
+
+        # Setiap epoch: satu lintasan SGD per sampel atas batch yang diacak ulang
+        rng = np.random.default_rng(self.random_state + self.n_updates)
+        for _ in range(self.epochs):
+            order = rng.permutation(len(X_scaled))
+            self.model.partial_fit(X_scaled[order], y[order], classes=CLASSES)
+        self.n_updates += 1
+        return self
+
+    def predict_proba(self, X):
+        return self.model.predict_proba(self.scaler.transform(np.asarray(X, dtype=np.float64)))
+
+    def predict(self, X):
+        return self.model.predict(self.scaler.transform(np.asarray(X, dtype=np.float64)))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Tulis ke file sementara lalu ganti, agar checkpoint lama tidak rusak jika proses terhenti
+        tmp_path = path + ".tmp"
+        # Hanya objek scikit-learn dan nilai biasa yang disimpan (bukan instance kelas ini),
+        # sehingga checkpoint dari `python online.py` dapat dimuat dari modul lain
+        state = {"scaler": self.scaler, "model": self.model, "epochs": self.epochs,
+                 "random_state": self.random_state, "n_updates": self.n_updates}
+        joblib.dump({"version": CHECKPOINT_VERSION, "state": state}, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        payload = joblib.load(path)
+        if payload.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Versi checkpoint {payload.get('version')} tidak didukung (diharapkan {CHECKPOINT_VERSION}).")
+        state = payload["state"]
+        online = cls(epochs=state["epochs"], random_state=state["random_state"])
+        online.scaler = state["scaler"]
+        online.model = state["model"]
+        online.n_updates = state["n_updates"]
+        return online
+
+
+def update_from_csv(path, checkpoint=DEFAULT_CHECKPOINT):
+    """Memperbarui model dari file CSV batch baru; checkpoint disimpan setelah setiap chunk."""
+    online = OnlineModel.load(checkpoint) if os.path.exists(checkpoint) else OnlineModel()
+    for chunk in read_chunks(path):
+        chunk = chunk.dropna()
+        online.partial_fit(chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float64),
+                           chunk[TARGET_COLUMN].to_numpy(dtype=np.int64))
+        online.save(checkpoint)
+    return online
+
+
+def compare(data_path="dataset.csv", n_batches=8):
+    """Membandingkan update inkremental dengan refit penuh pada batch yang datang bertahap.
+
+    Data latih (80%, `random_state=42`) dibagi menjadi `n_batches` batch. Setelah setiap
+    batch, dicatat waktu update inkremental, waktu refit penuh (StandardScaler +
+    LogisticRegression pada semua data yang sudah masuk) dan metrik keduanya pada data uji.
+    """
+    df = load_data(data_path)
+    X = df[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    y = df[TARGET_COLUMN].to_numpy(dtype=np.int64)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    online = OnlineModel()
+    rows = []
+    for i, idx in enumerate(np.array_split(np.arange(len(X_train)), n_batches), start=1):
+        start = time.perf_counter()
+        online.partial_fit(X_train[idx], y_train[idx])
+        online_time = time.perf_counter() - start
+
+        seen = slice(0, idx[-1] + 1)
+        start = time.perf_counter()
+        scaler = StandardScaler().fit(X_train[seen])
+        full = LogisticRegression(random_state=42).fit(scaler.transform(X_train[seen]), y_train[seen])
+        full_time = time.perf_counter() - start
+
+        online_scores, _ = evaluate(y_test, online.predict(X_test))
+        full_scores, _ = evaluate(y_test, full.predict(scaler.transform(X_test)))
+        rows.append({
+            "Batch": i, "Baris": online.n_seen,
+            "Update (ms)": online_time * 1000, "Refit (ms)": full_time * 1000,
+            **{f"{m} (inkremental)": s for m, s in zip(METRIC_NAMES, online_scores)},
+            **{f"{m} (refit)": s for m, s in zip(METRIC_NAMES, full_scores)},
+        })
+    return pd.DataFrame(rows).set_index("Batch")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pelatihan inkremental untuk batch pasien baru.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    update = sub.add_parser("update", help="Perbarui model dengan file CSV batch baru berlabel")
+    update.add_argument("input", help="File CSV dengan 8 kolom fitur dan kolom Outcome")
+    update.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT)
+
+    comp = sub.add_parser("compare", help="Bandingkan update inkremental dengan refit penuh")
+    comp.add_argument("--data", default="dataset.csv")
+    comp.add_argument("--batches", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.command == "update":
+        start = time.perf_counter()
+        online = update_from_csv(args.input, args.checkpoint)
+        print(f"Update ke-{online.n_updates} | Total baris: {online.n_seen} | "
+              f"Waktu update: {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(f"Checkpoint disimpan di: {args.checkpoint}")
+    else:
+        with pd.option_context("display.max_columns", None, "display.width", 200):
+            print(compare(args.data, args.batches).round(4))
+
+
+if __name__ == "__main__":
+    main()
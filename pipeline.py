@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""Langkah-langkah pelatihan dari submission.py dalam bentuk fungsi yang dapat dipakai ulang.
+
+Pembagian data 80/20 dengan `random_state=42` seperti notebook, lalu preprocessing
+(nol sebagai nilai kosong, imputasi median, standardisasi) yang di-fit hanya pada
+data latih, kemudian pelatihan dan evaluasi Logistic Regression, Random Forest dan
+SVM (eksak dan/atau aproksimasi Nystroem). Tidak ada visualisasi di modul ini.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.model_selection import StratifiedKFold, train_test_split
+from sklearn.pipeline import make_pipeline
+from sklearn.svm import SVC
+from threadpoolctl import threadpool_limits
+
+from instrumentation import stage
+from metrics import ThresholdCurve, confusion_counts, predict_with_scores, scores_from_confusion
+from preprocessing import build_preprocessor, cache_key, frame_fingerprint, load_cached, save_cached
+from schema import ALL_COLUMNS, FEATURE_COLUMNS, TARGET_COLUMN, ZERO_AS_MISSING_COLUMNS
+from streaming import load_dataset
+
+METRIC_NAMES = ["Accuracy", "Precision", "Recall", "F1-Score"]
+APPROX_SVM_NAME = "SVM (Nystroem)"
+DEFAULT_NYSTROEM_COMPONENTS = 300
+# Di atas jumlah baris latih ini SVC eksak terlalu lambat dan sebaiknya diganti mode approx
+MAX_EXACT_SVM_ROWS = 50_000
+
+
+def load_data(path="dataset.csv"):
+    with stage("load") as s:
+        df = load_dataset(path)
+        s.rows = len(df)
+    return df
+
+
+def _preprocess_params():
+    return {"columns": FEATURE_COLUMNS, "zero_as_missing": ZERO_AS_MISSING_COLUMNS, "impute": "median"}
+
+
+def prepare_data(df, test_size=0.2, random_state=42, cache_dir=None, fingerprint=None, split=None):
+    """Pembagian data latih/uji lalu preprocessing (lihat `preprocessing.build_preprocessor`).
+
+    Data dibagi lebih dulu dan preprocessor hanya di-fit pada data latih. Mengembalikan
+    `(preprocessor, X_train, X_test, y_train, y_test)` sebagai array NumPy dengan urutan
+    kolom `FEATURE_COLUMNS`.
+
+    Jika `cache_dir` diberikan, hasilnya di-cache dengan kunci `fingerprint` data (default:
+    hash isi `df`) dan parameter; pemanggilan berikutnya dengan input sama tidak
+    menjalankan preprocessing sama sekali.
+
+    `split` adalah `(train_index, test_index)` yang sudah tersimpan (lihat
+    `columnar.ColumnarData.split_indices`); default-nya dihitung dengan `train_test_split`.
+    """
+    params = {**_preprocess_params(), "test_size": test_size, "random_state": random_state}
+    if cache_dir:
+        with stage("fingerprint", rows=len(df)):
+            fingerprint = fingerprint or frame_fingerprint(df[ALL_COLUMNS])
+            directory = os.path.join(cache_dir, cache_key(fingerprint, params))
+        if os.path.exists(directory):
+            with stage("preprocess_cache", rows=len(df), hit=True):
+                return load_cached(directory)
+
+    features = df[FEATURE_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+    target = df[TARGET_COLUMN].to_numpy(dtype=np.int64)
+    with stage("split", rows=len(features)):
+        if split is None:
+            X_train, X_test, y_train, y_test = train_test_split(
+                features, target, test_size=test_size, random_state=random_state)
+        else:
+            train_index, test_index = split
+            X_train, X_test, y_train, y_test = (features[train_index], features[test_index],
+                                                target[train_index], target[test_index])
+    with stage("preprocessing", rows=len(features)):
+        preprocessor = build_preprocessor()
+        X_train = preprocessor.fit_transform(X_train)
+        X_test = preprocessor.transform(X_test)
+
+    if cache_dir:
+        with stage("preprocess_cache", rows=len(df), hit=False):
+            os.makedirs(cache_dir, exist_ok=True)
+            save_cached(directory, preprocessor, (X_train, X_test, y_train, y_test),
+                        {"fingerprint": fingerprint, "params": params})
+    return preprocessor, X_train, X_test, y_train, y_test
+
+
+def prepare_folds(df, cache_dir, n_splits=5, random_state=42, fingerprint=None):
+    """Stratified k-fold: preprocessor di-fit pada bagian latih setiap fold lalu disimpan ke cache.
+
+    Mengembalikan daftar direktori cache (satu per fold, format `preprocessing.save_cached`)
+    yang dapat dibuka sebagai memmap read-only oleh banyak proses sekaligus. Fold yang
+    sudah ada di cache tidak dihitung ulang.
+    """
+    with stage("fingerprint", rows=len(df)):
+        fingerprint = fingerprint or frame_fingerprint(df[ALL_COLUMNS])
+    features = df[FEATURE_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+    target = df[TARGET_COLUMN].to_numpy(dtype=np.int64)
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+    directories = []
+    for fold, (train_index, val_index) in enumerate(splitter.split(features, target)):
+        params = {**_preprocess_params(), "cv_splits": n_splits, "fold": fold, "random_state": random_state}
+        directory = os.path.join(cache_dir, cache_key(fingerprint, params))
+        if not os.path.exists(directory):
+            with stage("preprocessing", rows=len(train_index), fold=fold):
+                preprocessor = build_preprocessor()
+                X_train = preprocessor.fit_transform(features[train_index])
+                X_val = preprocessor.transform(features[val_index])
+            os.makedirs(cache_dir, exist_ok=True)
+            save_cached(directory, preprocessor, (X_train, X_val, target[train_index], target[val_index]),
+                        {"fingerprint": fingerprint, "params": params})
+        directories.append(directory)
+    return directories
+
+
+def build_models(svm_mode="exact", n_components=DEFAULT_NYSTROEM_COMPONENTS):
+    """Model kandidat yang sama dengan dict `models` pada submission.py.
+
+    `svm_mode` menentukan kandidat SVM:
+    - "exact": `SVC(kernel='rbf')` seperti notebook (berskala kuadratik terhadap jumlah baris).
+    - "approx": kernel RBF didekati dengan peta fitur Nystroem berukuran `n_components`
+      lalu SVM linear (hinge loss) yang dilatih dengan SGD, sehingga fit dan prediksi
+      berskala linear terhadap jumlah baris.
+    - "both": keduanya, untuk dibandingkan pada ukuran data yang masih memungkinkan.
+    """
+    if svm_mode not in ("exact", "approx", "both"):
+        raise ValueError(f"svm_mode tidak dikenal: {svm_mode!r}")
+    models = {
+        "Logistic Regression": LogisticRegression(random_state=42),
+        "Random Forest": RandomForestClassifier(random_state=42),
+    }
+    if svm_mode in ("exact", "both"):
+        models["SVM"] = SVC(kernel='rbf', random_state=42)
+    if svm_mode in ("approx", "both"):
+        # gamma=None berarti 1/n_fitur, sama dengan gamma='scale' milik SVC untuk data terstandardisasi
+        models[APPROX_SVM_NAME] = make_pipeline(
+            Nystroem(kernel='rbf', n_components=n_components, random_state=42),
+            SGDClassifier(loss='hinge', average=True, random_state=42),
+        )
+    return models
+
+
+def evaluate(y_true, y_pred):
+    """Mengembalikan `([accuracy, precision, recall, f1], confusion_matrix)`.
+
+    Keempat metrik diturunkan dari satu confusion matrix sehingga label hanya dibaca sekali.
+    """
+    cm = confusion_counts(y_true, y_pred)
+    return scores_from_confusion(cm), cm
+
+
+def split_core_budget(n_jobs, n_models):
+    """Membagi `n_jobs` core menjadi jumlah proses paralel dan thread per model.
+
+    Total proses x thread tidak melebihi budget sehingga kedua level paralelisme
+    tidak saling berebut core.
+    """
+    if n_jobs is None or n_jobs == 0:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    n_processes = max(1, min(n_jobs, n_models))
+    return n_processes, max(1, n_jobs // n_processes)
+
+
+def _fit_one(name, model, X_train, y_train, X_test, y_test, n_threads=None):
+    # Random Forest memakai jatah core sebagai n_jobs hanya selama fit/predict; nilai
+    # aslinya dikembalikan agar tidak ikut tersimpan di artefak model
+    set_jobs = n_threads is not None and isinstance(model, RandomForestClassifier)
+    if set_jobs:
+        original_n_jobs = model.n_jobs
+        model.set_params(n_jobs=n_threads)
+    try:
+        # Membatasi thread BLAS/OpenMP di dalam worker sesuai jatah core
+        with threadpool_limits(limits=n_threads):
+            with stage(f"fit:{name}", rows=len(X_train)):
+                start = time.perf_counter()
+                model.fit(X_train, y_train)
+                fit_time = time.perf_counter() - start
+            with stage(f"predict:{name}", rows=len(X_test)):
+                y_pred, y_score = predict_with_scores(model, X_test)
+    finally:
+        if set_jobs:
+            model.set_params(n_jobs=original_n_jobs)
+    with stage(f"metrics:{name}", rows=len(y_test)):
+        scores, cm = evaluate(y_test, y_pred)
+        curve = ThresholdCurve(y_test, y_score)
+    return model, scores, cm, fit_time, curve, (y_pred, y_score)
+
+
+def fit_and_evaluate(models, X_train, y_train, X_test, y_test, n_jobs=1):
+    """Melatih dan mengevaluasi setiap model.
+
+    Mengembalikan `(results, conf_matrices, fit_times, curves, predictions)`; `curves`
+    berisi `metrics.ThresholdCurve` dari skor data uji setiap model untuk kurva ROC/PR,
+    dan `predictions` berisi `(y_pred, y_score)` data uji setiap model agar dapat
+    dipakai ulang (misalnya untuk bootstrap) tanpa inferensi ulang.
+
+    Dengan `n_jobs` > 1 (atau -1 untuk semua core), model-model dilatih bersamaan di
+    process pool. Random Forest mendapat `n_jobs` sesuai jatah core per proses selama
+    fit/predict (nilai `n_jobs` aslinya dikembalikan setelahnya), sedangkan thread BLAS
+    model lain dibatasi dengan jatah yang sama. Model terlatih
+    dikembalikan ke dict `models`, dan urutan `results`/`conf_matrices` tetap
+    mengikuti urutan `models`.
+    """
+    results = {}
+    conf_matrices = {}
+    fit_times = {}
+    curves = {}
+    predictions = {}
+    if n_jobs in (None, 1):
+        for name, model in models.items():
+            _, results[name], conf_matrices[name], fit_times[name], curves[name], predictions[name] = _fit_one(
+                name, model, X_train, y_train, X_test, y_test)
+        return results, conf_matrices, fit_times, curves, predictions
+
+    n_processes, n_threads = split_core_budget(n_jobs, len(models))
+    if n_processes == 1:
+        for name, model in models.items():
+            _, results[name], conf_matrices[name], fit_times[name], curves[name], predictions[name] = _fit_one(
+                name, model, X_train, y_train, X_test, y_test, n_threads)
+        return results, conf_matrices, fit_times, curves, predictions
+
+    with ProcessPoolExecutor(max_workers=n_processes) as executor:
+        futures = {name: executor.submit(_fit_one, name, model, X_train, y_train, X_test, y_test, n_threads)
+                   for name, model in models.items()}
+        for name, future in futures.items():
+            (models[name], results[name], conf_matrices[name], fit_times[name], curves[name],
+             predictions[name]) = future.result()
+    return results, conf_matrices, fit_times, curves, predictions
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Visualisasi EDA dan evaluasi untuk mode headless.
+
+Data untuk setiap grafik (hitungan histogram, statistik boxplot, kurva KDE)
+dihitung sekali dengan NumPy, sehingga menggambar grafik tidak perlu lagi
+menyentuh seluruh baris data. Grafik digambar dengan backend non-interaktif
+`Agg` dan disimpan ke file, bisa paralel di process pool.
+
+matplotlib hanya diimpor di dalam fungsi penggambar (di worker), bukan di level modul.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from artifacts import safe_filename
+
+KDE_SAMPLE_SIZE = 10_000
+MAX_FLIERS = 1_000
+MAX_CURVE_POINTS = 2_000
+METRIC_COLORS = ['#4CAF50', '#2196F3', '#FFC107', '#E91E63']
+CLASS_LABELS = ['Tidak Diabetes (0)', 'Diabetes (1)']
+
+
+# ------------------------------------------------------------
+# Perhitungan data grafik (NumPy)
+# ------------------------------------------------------------
+
+def histogram_data(values, bins=30, kde=True, kde_sample_size=KDE_SAMPLE_SIZE, random_state=42):
+    """Hitungan histogram dan (opsional) kurva KDE dari sampel terbatas untuk satu kolom.
+
+    Kurva KDE diskalakan ke satuan jumlah, seperti `sns.histplot(..., kde=True)`.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    data = {"counts": counts, "edges": edges}
+    if kde and len(values) > 1:
+        rng = np.random.default_rng(random_state)
+        sample = values if len(values) <= kde_sample_size else rng.choice(values, kde_sample_size, replace=False)
+        # Bandwidth aturan Scott
+        bandwidth = sample.std(ddof=1) * len(sample) ** (-1 / 5)
+        if bandwidth > 0:
+            grid = np.linspace(edges[0], edges[-1], 200)
+            z = (grid[:, None] - sample[None, :]) / bandwidth
+            density = np.exp(-0.5 * z ** 2).sum(axis=1) / (len(sample) * bandwidth * np.sqrt(2 * np.pi))
+            data["kde_x"] = grid
+            data["kde_y"] = density * len(values) * (edges[1] - edges[0])
+    return data
+
+
+def boxplot_stats(values, label, max_fliers=MAX_FLIERS, random_state=42):
+    """Statistik boxplot (kuartil, whisker 1.5 IQR, outlier) untuk `Axes.bxp`.
+
+    Jumlah outlier yang digambar dibatasi `max_fliers` dengan sampel acak.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    inside = values[(values >= low) & (values <= high)]
+    fliers = values[(values < low) | (values > high)]
+    if len(fliers) > max_fliers:
+        fliers = np.random.default_rng(random_state).choice(fliers, max_fliers, replace=False)
+    return {
+        "label": label, "med": med, "q1": q1, "q3": q3,
+        "whislo": inside.min() if len(inside) else q1,
+        "whishi": inside.max() if len(inside) else q3,
+        "fliers": fliers,
+    }
+
+
+# ------------------------------------------------------------
+# Penggambar grafik (dijalankan di worker dengan backend Agg)
+# ------------------------------------------------------------
+
+def _pyplot():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def draw_distributions(histograms, path):
+    plt = _pyplot()
+    palette = plt.get_cmap("Set2").colors
+    fig = plt.figure(figsize=(18, 14))
+    for i, (col, data) in enumerate(histograms.items()):
+        ax = fig.add_subplot(3, 3, i + 1)
+        color = palette[i % len(palette)]
+        ax.stairs(data["counts"], data["edges"], fill=True, color=color, alpha=0.6)
+        if "kde_x" in data:
+            ax.plot(data["kde_x"], data["kde_y"], color=color)
+        ax.set_title(f'Distribusi: {col}', fontsize=14, fontweight='bold')
+        ax.set_xlabel(col, fontsize=12)
+        ax.set_ylabel('Jumlah', fontsize=12)
+        ax.grid(True, linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def draw_boxplot(stats, path):
+    plt = _pyplot()
+    palette = plt.get_cmap("Set2").colors
+    fig, ax = plt.subplots(figsize=(16, 10))
+    boxes = ax.bxp(stats, patch_artist=True)
+    for i, box in enumerate(boxes["boxes"]):
+        box.set_facecolor(palette[i % len(palette)])
+    ax.set_title("Boxplot Fitur Sebelum Normalisasi", fontsize=18, fontweight='bold')
+    ax.set_xlabel("Fitur", fontsize=14)
+    ax.set_ylabel("Nilai", fontsize=14)
+    plt.setp(ax.get_xticklabels(), rotation=30, ha='right', fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def draw_heatmap(corr, labels, path):
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    image = ax.imshow(corr, cmap="coolwarm", vmin=-1, vmax=1)
+    for (i, j), val in np.ndenumerate(corr):
+        ax.text(j, i, f"{val:.2f}", ha='center', va='center', fontsize=8)
+    ax.set_xticks(range(len(labels)), labels, rotation=90)
+    ax.set_yticks(range(len(labels)), labels)
+    ax.set_title("Matriks Korelasi Fitur")
+    fig.colorbar(image)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def draw_metrics(results, metric_names, path):
+    plt = _pyplot()
+    names = list(results)
+    values = np.array([results[name] for name in names])
+    width = 0.8 / len(metric_names)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for k, metric in enumerate(metric_names):
+        positions = np.arange(len(names)) - 0.4 + width * (k + 0.5)
+        bars = ax.bar(positions, values[:, k], width, label=metric, color=METRIC_COLORS[k % len(METRIC_COLORS)])
+        for bar in bars:
+            ax.annotate(f"{bar.get_height():.2f}", (bar.get_x() + bar.get_width() / 2, bar.get_height()),
+                        ha='center', va='bottom', fontsize=10, color='black')
+    ax.set_xticks(range(len(names)), names)
+    ax.set_title("Perbandingan Metrik Evaluasi Antar Model", fontsize=16, fontweight='bold')
+    ax.set_xlabel("Model", fontsize=14)
+    ax.set_ylabel("Nilai Metrik", fontsize=14)
+    ax.set_ylim(0, 1)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.legend(title="Metrik", fontsize=12, title_fontsize=12, loc='lower right')
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def draw_confusion_matrix(name, cm, path):
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(5, 4))
+    cax = ax.matshow(cm, cmap='Blues')
+    for (i, j), val in np.ndenumerate(cm):
+        ax.text(j, i, f'{val}', ha='center', va='center', color='black')
+    ax.set_title(f'Confusion Matrix: {name}')
+    ax.set_xlabel('Prediksi')
+    ax.set_ylabel('Aktual')
+    ax.set_xticks([0, 1], CLASS_LABELS)
+    ax.set_yticks([0, 1], CLASS_LABELS)
+    fig.colorbar(cax)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def curve_data(curve, max_points=MAX_CURVE_POINTS):
+    """Titik kurva ROC dan PR dari `metrics.ThresholdCurve`, dijarangkan ke `max_points`."""
+    fpr, tpr, _ = curve.roc()
+    precision, recall, _ = curve.pr()
+    keep = np.unique(np.linspace(0, len(fpr) - 1, min(len(fpr), max_points)).astype(int))
+    keep_pr = np.unique(np.linspace(0, len(recall) - 1, min(len(recall), max_points)).astype(int))
+    return {"fpr": fpr[keep], "tpr": tpr[keep], "auc": curve.roc_auc(),
+            "recall": recall[keep_pr], "precision": precision[keep_pr], "ap": curve.average_precision()}
+
+
+def draw_curves(curves, path):
+    plt = _pyplot()
+    fig, (ax_roc, ax_pr) = plt.subplots(1, 2, figsize=(12, 5))
+    for name, data in curves.items():
+        ax_roc.plot(data["fpr"], data["tpr"], label=f"{name} (AUC={data['auc']:.3f})")
+        ax_pr.plot(data["recall"], data["precision"], label=f"{name} (AP={data['ap']:.3f})")
+    ax_roc.plot([0, 1], [0, 1], linestyle='--', color='gray')
+    ax_roc.set_title('Kurva ROC')
+    ax_roc.set_xlabel('False Positive Rate')
+    ax_roc.set_ylabel('Recall (True Positive Rate)')
+    ax_pr.set_title('Kurva Precision-Recall')
+    ax_pr.set_xlabel('Recall')
+    ax_pr.set_ylabel('Precision')
+    for ax in (ax_roc, ax_pr):
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1.02)
+        ax.grid(linestyle='--', alpha=0.7)
+        ax.legend(loc='lower right' if ax is ax_roc else 'lower left')
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+# ------------------------------------------------------------
+# Daftar tugas dan render paralel
+# ------------------------------------------------------------
+
+def eda_tasks(features, columns, corr, corr_labels, output_dir):
+    """Tugas render untuk histogram+KDE, boxplot dan heatmap korelasi.
+
+    `features` adalah array 2D fitur mentah; `corr` matriks korelasi yang sudah dihitung.
+    """
+    features = np.asarray(features, dtype=np.float64)
+    histograms = {col: histogram_data(features[:, i]) for i, col in enumerate(columns)}
+    stats = [boxplot_stats(features[:, i], col) for i, col in enumerate(columns)]
+    return [
+        (draw_distributions, (histograms, os.path.join(output_dir, "distribusi.png"))),
+        (draw_boxplot, (stats, os.path.join(output_dir, "boxplot.png"))),
+        (draw_heatmap, (np.asarray(corr), list(corr_labels), os.path.join(output_dir, "korelasi.png"))),
+    ]
+
+
+def evaluation_tasks(results, conf_matrices, metric_names, output_dir, curves=None):
+    """Tugas render untuk grafik perbandingan metrik, confusion matrix dan (opsional) kurva ROC/PR."""
+    tasks = [(draw_metrics, (results, metric_names, os.path.join(output_dir, "metrik.png")))]
+    for name, cm in conf_matrices.items():
+        filename = "confusion_" + safe_filename(name) + ".png"
+        tasks.append((draw_confusion_matrix, (name, cm, os.path.join(output_dir, filename))))
+    if curves:
+        data = {name: curve_data(curve) for name, curve in curves.items()}
+        tasks.append((draw_curves, (data, os.path.join(output_dir, "kurva_roc_pr.png"))))
+    return tasks
+
+
+def _run(task):
+    func, args = task
+    func(*args)
+    return args[-1]
+
+
+def render(tasks, n_workers=1):
+    """Menggambar semua tugas ke file; mengembalikan daftar path file yang dihasilkan."""
+    for _, args in tasks:
+        os.makedirs(os.path.dirname(args[-1]) or ".", exist_ok=True)
+    if n_workers <= 1:
+        return [_run(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_run, tasks))
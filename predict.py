@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Prediksi cepat dari artefak hasil `train.py` tanpa melatih ulang model.
+
+Hanya memuat artefak (tanpa membaca dataset, tanpa matplotlib/seaborn). Model
+Logistic Regression dihitung langsung dengan NumPy dari `scorer.npz` dan Random
+Forest dari `forest.npz`; model lain dapat dipilih dengan `--model` dan akan dimuat
+melalui scikit-learn.
+
+`ForestScorer` hanya unggul untuk batch kecil: penelusuran NumPy-nya sekitar 2-3x lebih
+lambat per baris daripada scikit-learn, tetapi tidak perlu mengimpor scikit-learn dan
+memuat model joblib (sekitar 1 detik). Untuk satu kali jalan script ini titik impasnya
+sekitar 150 ribu baris, sehingga input di atas `FOREST_SCORER_MAX_ROWS` dihitung dengan
+model scikit-learn. Untuk proses yang sudah memuat kedua model (lihat
+`python benchmark.py --forest`), titik impasnya jauh lebih kecil, sekitar 1.000 baris.
+
+Contoh penggunaan:
+    python predict.py 6 148 72 35 0 33.6 0.627 50
+    python predict.py --input pasien.csv
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import csv
+import sys
+
+import numpy as np
+
+from artifacts import (DEFAULT_ARTIFACT_DIR, FOREST_MODEL_NAME, LINEAR_MODEL_NAME, load_forest, load_manifest,
+                       load_model, load_preprocessor, load_scorer)
+from instrumentation import stage
+from schema import RISK_MESSAGES
+from scoring import risk_flags
+
+# Batas jumlah baris untuk ForestScorer; di atasnya model scikit-learn lebih cepat
+# walaupun termasuk waktu impor dan pemuatan model (lihat docstring modul)
+FOREST_SCORER_MAX_ROWS = 100_000
+
+
+def read_input_csv(path, columns):
+    """Membaca CSV pasien dan mengurutkan kolomnya sesuai `columns` dari artefak."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        index = [header.index(col) for col in columns]
+        rows = [[float(row[i]) for i in index] for row in reader if row]
+    return np.array(rows, dtype=np.float64).reshape(-1, len(columns))
+
+
+def predict_scores(X, artifact_dir, model_name, manifest):
+    """Skor kelas positif: `(skor, is_probability)`.
+
+    Model tanpa `predict_proba` (SVC tanpa `probability=True`) mengembalikan nilai
+    `decision_function` dengan `is_probability=False`; kelasnya positif jika skor > 0.
+    """
+    if model_name == LINEAR_MODEL_NAME:
+        return load_scorer(artifact_dir).predict_proba(X), True
+    if model_name == FOREST_MODEL_NAME and len(X) <= FOREST_SCORER_MAX_ROWS:
+        return load_forest(artifact_dir).predict_proba(X), True
+
+    preprocessor = load_preprocessor(artifact_dir)
+    model = load_model(artifact_dir, model_name, manifest)
+    X_scaled = preprocessor.transform(X)
+    if hasattr(model, "predict_proba"):
+        return model.predict_proba(X_scaled)[:, 1], True
+    return model.decision_function(X_scaled), False
+
+
+def print_single(x, score, is_probability=True):
+    positive = score > 0.5 if is_probability else score > 0
+    print(f"Hasil Prediksi: {'Diabetes (1)' if positive else 'Tidak Diabetes (0)'}")
+    if is_probability:
+        print(f"Probabilitas Keyakinan Model: {score if positive else 1 - score:.4f}")
+    else:
+        print(f"Skor Keputusan (decision_function): {score:.4f} "
+              f"(model ini tidak menyediakan probabilitas; kelas positif jika skor > 0)")
+
+    if positive:
+        print("\nIndikator Risiko Diabetes:")
+        for name, mask in risk_flags(x[None, :]).items():
+            if mask[0]:
+                print(f"  - {RISK_MESSAGES[name[len('Risk_'):]]}")
+    else:
+        print("\nIndikator Risiko Tidak Diabetes:")
+        print("  - Semua fitur berada dalam rentang yang wajar.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prediksi diabetes dari artefak model yang sudah dilatih.")
+    parser.add_argument("values", nargs="*", type=float, help="8 nilai fitur satu pasien sesuai urutan kolom")
+    parser.add_argument("--input", help="File CSV berisi banyak pasien")
+    parser.add_argument("--artifact", default=DEFAULT_ARTIFACT_DIR, help="Direktori artefak dari train.py")
+    parser.add_argument("--model", default=LINEAR_MODEL_NAME, help="Nama model di artefak")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.artifact)
+    columns = manifest["columns"]
+    if args.input:
+        X = read_input_csv(args.input, columns)
+    elif len(args.values) == len(columns):
+        X = np.array([args.values], dtype=np.float64)
+    else:
+        parser.error(f"Berikan {len(columns)} nilai fitur ({', '.join(columns)}) atau --input")
+
+    with stage("prediction", rows=len(X), model=args.model):
+        scores, is_probability = predict_scores(X, args.artifact, args.model, manifest)
+    elapsed_ms = (time.perf_counter() - _START) * 1000
+
+    if args.input:
+        writer = csv.writer(sys.stdout)
+        flags = risk_flags(X)
+        cutoff = 0.5 if is_probability else 0.0
+        writer.writerow(["Prediction", "Probability" if is_probability else "DecisionScore", *flags])
+        for i, score in enumerate(scores):
+            writer.writerow([int(score > cutoff), f"{score:.6f}", *(bool(mask[i]) for mask in flags.values())])
+    else:
+        print_single(X[0], scores[0], is_probability)
+
+    print(f"\nWaktu hingga prediksi pertama: {elapsed_ms:.1f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Pipeline preprocessing fitur dengan cache di disk.
+
+Langkah-langkahnya (lihat `build_preprocessor`):
+1. Nilai 0 pada `ZERO_AS_MISSING_COLUMNS` diubah menjadi NaN (nilai kosong).
+2. NaN diisi median kolom dari data latih (`SimpleImputer`).
+3. Standardisasi dengan `StandardScaler`.
+
+Preprocessor hanya di-fit pada data latih setelah pembagian data, sehingga
+statistik data uji tidak bocor ke model. Hasilnya (preprocessor yang sudah di-fit
+dan array latih/uji) disimpan di `cache_dir/<kunci>/`, dengan kunci berupa hash
+dari fingerprint data dan semua parameter. Eksperimen berikutnya dengan input yang
+sama langsung memuat array dari cache tanpa preprocessing ulang.
+
+scikit-learn hanya diimpor di dalam fungsi agar `scoring.py` tetap ringan.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+from schema import FEATURE_COLUMNS, ZERO_AS_MISSING_COLUMNS
+
+PREPROCESS_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(".cache", "preprocess")
+ARRAY_NAMES = ("X_train", "X_test", "y_train", "y_test")
+
+
+def zero_to_nan(X, columns):
+    """Salinan `X` dengan nilai 0 pada indeks kolom `columns` diganti NaN."""
+    X = np.array(X, dtype=np.float64)
+    block = X[:, columns]
+    block[block == 0] = np.nan
+    X[:, columns] = block
+    return X
+
+
+def zero_missing_indices(columns=FEATURE_COLUMNS, zero_columns=ZERO_AS_MISSING_COLUMNS):
+    return [i for i, col in enumerate(columns) if col in zero_columns]
+
+
+def build_preprocessor(columns=FEATURE_COLUMNS, zero_columns=ZERO_AS_MISSING_COLUMNS):
+    """Pipeline scikit-learn: nol -> NaN, imputasi median, lalu standardisasi."""
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+    return Pipeline([
+        ("zero_to_nan", FunctionTransformer(zero_to_nan, kw_args={"columns": zero_missing_indices(columns, zero_columns)},
+                                            feature_names_out="one-to-one")),
+        ("impute", SimpleImputer(strategy="median")),
+        ("scale", StandardScaler()),
+    ])
+
+
+def folded_params(preprocessor):
+    """Parameter preprocessor yang sudah di-fit dalam bentuk array NumPy.
+
+    Mengembalikan `(fill, zero_missing, mean, scale)`: nilai pengganti per kolom,
+    mask kolom yang nilai 0-nya dianggap kosong, serta mean/scale standardisasi.
+    `StandardScaler` biasa (tanpa imputasi) menghasilkan `fill=None`.
+    """
+    if not hasattr(preprocessor, "named_steps"):
+        return None, None, preprocessor.mean_, preprocessor.scale_
+    scaler = preprocessor.named_steps["scale"]
+    zero_missing = np.zeros(len(scaler.mean_), dtype=bool)
+    zero_missing[preprocessor.named_steps["zero_to_nan"].kw_args["columns"]] = True
+    return preprocessor.named_steps["impute"].statistics_, zero_missing, scaler.mean_, scaler.scale_
+
+
+def cache_key(fingerprint, params):
+    import sklearn
+
+    payload = json.dumps({"fingerprint": fingerprint, "params": params, "version": PREPROCESS_VERSION,
+                          "sklearn": sklearn.__version__}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def frame_fingerprint(df):
+    """Fingerprint isi DataFrame (hash per baris dari pandas), dipakai jika fingerprint file tidak ada."""
+    import pandas as pd
+
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()
+
+
+def load_cached(directory):
+    """Memuat `(preprocessor, X_train, X_test, y_train, y_test)` dari cache; array dibuka sebagai memmap."""
+    import joblib
+
+    preprocessor = joblib.load(os.path.join(directory, "preprocessor.joblib"))
+    arrays = [np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in ARRAY_NAMES]
+    return (preprocessor, *arrays)
+
+
+def save_cached(directory, preprocessor, arrays, meta):
+    """Menulis cache ke direktori sementara lalu memindahkannya secara atomik."""
+    import joblib
+
+    tmp = f"{directory}.tmp-{os.getpid()}"
+    os.makedirs(tmp, exist_ok=True)
+    joblib.dump(preprocessor, os.path.join(tmp, "preprocessor.joblib"))
+    for name, array in zip(ARRAY_NAMES, arrays):
+        np.save(os.path.join(tmp, f"{name}.npy"), array)
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    try:
+        os.replace(tmp, directory)
+    except OSError:
+        # Proses lain sudah menulis cache yang sama lebih dulu
+        shutil.rmtree(tmp, ignore_errors=True)
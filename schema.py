@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Definisi kolom dataset Pima Indians Diabetes yang dipakai bersama oleh modul-modul proyek."""
+
+# Urutan kolom fitur sama dengan `features = df.drop(columns=['Outcome'])` pada submission.py
+FEATURE_COLUMNS = ['Pregnancies', 'Glucose', 'BloodPressure', 'SkinThickness', 'Insulin', 'BMI', 'DiabetesPedigreeFunction', 'Age']
+TARGET_COLUMN = 'Outcome'
+ALL_COLUMNS = FEATURE_COLUMNS + [TARGET_COLUMN]
+
+# Kolom yang nilai 0-nya secara medis tidak mungkin dan dianggap sebagai nilai kosong
+ZERO_AS_MISSING_COLUMNS = ['Glucose', 'BloodPressure', 'SkinThickness', 'Insulin', 'BMI']
+
+# Ambang batas indikator risiko diabetes (nilai > ambang dianggap berisiko)
+RISK_THRESHOLDS = {
+    'Glucose': 140,
+    'BMI': 30,
+    'Age': 45,
+    'DiabetesPedigreeFunction': 0.5,
+}
+
+RISK_MESSAGES = {
+    'Glucose': "Kadar glukosa tinggi.",
+    'BMI': "BMI menunjukkan obesitas.",
+    'Age': "Usia di atas 45 tahun.",
+    'DiabetesPedigreeFunction': "Ada faktor genetik (riwayat keluarga).",
+}
+
+# Skema tipe data ringkas untuk membaca CSV. Tipe integer nullable (Int8/Int16) tetap
+# memungkinkan nilai kosong terhitung sebagai null tanpa harus naik ke float64.
+DTYPES = {
+    'Pregnancies': 'Int8',
+    'Glucose': 'Int16',
+    'BloodPressure': 'Int16',
+    'SkinThickness': 'Int16',
+    'Insulin': 'Int16',
+    'BMI': 'float32',
+    'DiabetesPedigreeFunction': 'float32',
+    'Age': 'Int16',
+    'Outcome': 'Int8',
+}
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""Fungsi prediksi berbasis NumPy yang tidak membutuhkan pandas maupun scikit-learn.
+
+Kedua scorer menerima fitur mentah. Jika preprocessor berasal dari
+`preprocessing.build_preprocessor`, nilai 0 pada kolom tertentu dan NaN lebih dulu
+diganti median data latih (`fill`) sebelum dihitung.
+
+`LinearScorer` menyimpan standardisasi + `LogisticRegression` yang sudah dilipat
+menjadi satu vektor bobot dan satu bias:
+
+    logit = ((x - mean) / scale) @ coef + intercept
+          = x @ (coef / scale) + (intercept - sum(coef * mean / scale))
+
+sehingga prediksi cukup imputasi, satu perkalian titik dan sigmoid per baris.
+
+`ForestScorer` menyimpan preprocessing + `RandomForestClassifier` sebagai array
+NumPy datar (fitur, threshold, anak kiri/kanan, probabilitas daun) dari seluruh
+pohon, lalu menelusuri semua pohon untuk banyak baris sekaligus.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from preprocessing import folded_params
+from schema import FEATURE_COLUMNS, RISK_THRESHOLDS
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+# Baris per blok penelusuran hutan; array node berukuran blok x jumlah pohon
+DEFAULT_FOREST_BLOCK_ROWS = 1024
+# Setiap beberapa level, pasangan (baris, pohon) yang sudah di daun dikeluarkan dari iterasi
+_COMPACT_EVERY = 4
+
+
+def risk_flags(X):
+    """Mengembalikan dict {nama_flag: array bool} untuk setiap indikator risiko."""
+    X = np.asarray(X)
+    flags = {}
+    for feature, threshold in RISK_THRESHOLDS.items():
+        flags[f"Risk_{feature}"] = X[:, FEATURE_COLUMNS.index(feature)] > threshold
+    return flags
+
+
+def _impute(X, fill, zero_missing):
+    """Mengganti NaN, dan nilai 0 pada kolom `zero_missing`, dengan `fill` (salinan baru)."""
+    missing = np.isnan(X)
+    missing[:, zero_missing] |= X[:, zero_missing] == 0
+    return np.where(missing, fill, X)
+
+
+def _sigmoid(z):
+    # Bentuk stabil: exp hanya dihitung untuk nilai non-positif sehingga tidak overflow
+    e = np.exp(-np.abs(z))
+    return np.where(z >= 0, 1 / (1 + e), e / (1 + e))
+
+
+class LinearScorer:
+    """Scorer Logistic Regression pada fitur mentah (tanpa normalisasi terpisah)."""
+
+    def __init__(self, weights, bias, columns=FEATURE_COLUMNS, fill=None, zero_missing=None):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.columns = list(columns)
+        self.fill = None if fill is None else np.asarray(fill, dtype=np.float64)
+        self.zero_missing = None if zero_missing is None else np.asarray(zero_missing, dtype=bool)
+        self._weights32 = self.weights.astype(np.float32)
+
+    @classmethod
+    def from_sklearn(cls, preprocessor, model, columns=FEATURE_COLUMNS):
+        """Melipat mean/scale standardisasi ke koefisien dan intercept model."""
+        fill, zero_missing, mean, scale = folded_params(preprocessor)
+        coef = model.coef_.ravel()
+        weights = coef / scale
+        bias = model.intercept_[0] - np.dot(weights, mean)
+        return cls(weights, bias, columns, fill, zero_missing)
+
+    def save(self, path):
+        extra = {} if self.fill is None else {"fill": self.fill, "zero_missing": self.zero_missing}
+        np.savez(path, weights=self.weights, bias=np.array([self.bias]), columns=np.array(self.columns), **extra)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            fill = data["fill"] if "fill" in data else None
+            zero_missing = data["zero_missing"] if "zero_missing" in data else None
+            return cls(data["weights"], data["bias"][0], data["columns"].tolist(), fill, zero_missing)
+
+    def _prepare(self, X, dtype):
+        X = np.asarray(X, dtype=dtype)
+        if self.fill is None:
+            return X
+        return _impute(X, self.fill.astype(dtype), self.zero_missing)
+
+    def decision_function(self, X, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Logit untuk setiap baris `X` (array 2D, boleh memmap).
+
+        Input float32 dihitung dengan bobot float32 tanpa konversi ke float64;
+        input lain dihitung dalam float64. Data diproses per chunk agar array
+        memmap tidak perlu dimuat seluruhnya ke memori.
+        """
+        X = np.asarray(X)
+        if X.dtype == np.float32:
+            weights, bias = self._weights32, np.float32(self.bias)
+        else:
+            weights, bias = self.weights, self.bias
+        if len(X) <= chunk_size:
+            return self._prepare(X, weights.dtype) @ weights + bias
+
+        out = np.empty(len(X), dtype=weights.dtype)
+        for start in range(0, len(X), chunk_size):
+            out[start:start + chunk_size] = self._prepare(X[start:start + chunk_size], weights.dtype) @ weights
+        out += bias
+        return out
+
+    def predict_proba(self, X, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Probabilitas diabetes (kelas 1) untuk setiap baris, setara `predict_proba(...)[:, 1]`."""
+        return _sigmoid(self.decision_function(X, chunk_size))
+
+    def predict(self, X, chunk_size=DEFAULT_CHUNK_SIZE):
+        return (self.decision_function(X, chunk_size) > 0).astype(np.int8)
+
+
+def _float32_at_most(threshold):
+    """Float32 terbesar yang <= `threshold` (float64).
+
+    Untuk x float32, `x <= threshold` setara dengan `x <= _float32_at_most(threshold)`,
+    sehingga threshold dapat disimpan sebagai float32 tanpa mengubah arah percabangan.
+    """
+    out = threshold.astype(np.float32)
+    above = out.astype(np.float64) > threshold
+    out[above] = np.nextafter(out[above], np.float32(-np.inf))
+    return out
+
+
+class ForestScorer:
+    """Random Forest terkompilasi: seluruh pohon dalam array NumPy yang bersebelahan.
+
+    Node semua pohon digabung dengan indeks global. `children[2 * node + go_left]`
+    memberi node berikutnya; daun menunjuk ke dirinya sendiri sehingga penelusuran
+    cukup diulang sebanyak kedalaman pohon terdalam untuk semua baris dan pohon
+    sekaligus. Hasilnya sama persis dengan `predict`/`predict_proba` scikit-learn:
+    imputasi dan normalisasi sama dengan preprocessor, fitur dibandingkan sebagai
+    float32 seperti di scikit-learn, dan probabilitas daun dijumlahkan per pohon
+    dengan urutan yang sama.
+
+    Keunggulannya adalah latensi batch kecil tanpa scikit-learn; untuk ribuan baris ke
+    atas penelusuran ini 2-3x lebih lambat daripada scikit-learn (lihat
+    `predict.FOREST_SCORER_MAX_ROWS`).
+    """
+
+    def __init__(self, feature, threshold, children, missing_left, leaf_proba, roots, max_depth,
+                 mean, scale, classes, columns=FEATURE_COLUMNS, fill=None, zero_missing=None):
+        self.feature = np.asarray(feature)
+        self.threshold = np.asarray(threshold, dtype=np.float32)
+        self.children = np.asarray(children)
+        self.missing_left = np.asarray(missing_left, dtype=bool)
+        self.leaf_proba = np.asarray(leaf_proba, dtype=np.float64)
+        self.roots = np.asarray(roots)
+        self.max_depth = int(max_depth)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.classes = np.asarray(classes)
+        self.columns = list(columns)
+        self.fill = None if fill is None else np.asarray(fill, dtype=np.float64)
+        self.zero_missing = None if zero_missing is None else np.asarray(zero_missing, dtype=bool)
+
+    @classmethod
+    def from_sklearn(cls, preprocessor, model, columns=FEATURE_COLUMNS):
+        """Mengemas `model.estimators_` menjadi array datar dengan dtype sekecil mungkin."""
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        sizes = np.array([tree.node_count for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        n_nodes = int(sizes.sum())
+        index_dtype = np.int32 if n_nodes < np.iinfo(np.int32).max // 2 else np.int64
+
+        feature, threshold, children, missing_left, leaf_proba = [], [], [], [], []
+        for tree, offset in zip(trees, offsets):
+            nodes = np.arange(tree.node_count) + offset
+            is_leaf = tree.children_left == -1
+            left = np.where(is_leaf, nodes, tree.children_left + offset)
+            right = np.where(is_leaf, nodes, tree.children_right + offset)
+            # Urutan pasangan anak: indeks 0 = kanan, 1 = kiri (dipilih oleh hasil perbandingan)
+            children.append(np.column_stack([right, left]).ravel())
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+            missing_left.append(getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=np.uint8)))
+
+            # Sama dengan DecisionTreeClassifier.predict_proba
+            proba = tree.value[:, 0, :model.n_classes_].copy()
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            leaf_proba.append(proba / normalizer)
+
+        fill, zero_missing, mean, scale = folded_params(preprocessor)
+        feature_dtype = np.int8 if model.n_features_in_ <= np.iinfo(np.int8).max else np.int16
+        return cls(
+            feature=np.concatenate(feature).astype(feature_dtype),
+            threshold=_float32_at_most(np.concatenate(threshold)),
+            children=np.concatenate(children).astype(index_dtype),
+            missing_left=np.concatenate(missing_left).astype(bool),
+            leaf_proba=np.concatenate(leaf_proba),
+            roots=offsets.astype(index_dtype),
+            max_depth=max(tree.max_depth for tree in trees),
+            mean=mean,
+            scale=scale,
+            classes=model.classes_,
+            columns=columns,
+            fill=fill,
+            zero_missing=zero_missing,
+        )
+
+    def save(self, path):
+        extra = {} if self.fill is None else {"fill": self.fill, "zero_missing": self.zero_missing}
+        np.savez(path, feature=self.feature, threshold=self.threshold, children=self.children,
+                 missing_left=self.missing_left, leaf_proba=self.leaf_proba, roots=self.roots,
+                 max_depth=np.array([self.max_depth]), mean=self.mean, scale=self.scale,
+                 classes=self.classes, columns=np.array(self.columns), **extra)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            fill = data["fill"] if "fill" in data else None
+            zero_missing = data["zero_missing"] if "zero_missing" in data else None
+            return cls(data["feature"], data["threshold"], data["children"], data["missing_left"],
+                       data["leaf_proba"], data["roots"], data["max_depth"][0], data["mean"],
+                       data["scale"], data["classes"], data["columns"].tolist(), fill, zero_missing)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.feature, self.threshold, self.children, self.missing_left,
+                                      self.leaf_proba, self.roots))
+
+    def _leaves(self, Xs):
+        """Indeks daun global untuk setiap pasangan (baris, pohon), bentuk (n_baris, n_pohon)."""
+        n_rows, n_features = Xs.shape
+        n_trees = len(self.roots)
+        flat = Xs.ravel()
+        has_nan = np.isnan(flat).any()
+        node = np.tile(self.roots.astype(np.intp), n_rows)
+        base = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, n_trees)
+        leaves, active = node, None
+        for depth in range(1, self.max_depth + 1):
+            x = np.take(flat, base + np.take(self.feature, node))
+            go_left = x <= np.take(self.threshold, node)
+            if has_nan:
+                go_left |= np.isnan(x) & np.take(self.missing_left, node)
+            step = np.take(self.children, 2 * node + go_left)
+            if depth % _COMPACT_EVERY:
+                node = step.astype(np.intp)
+                continue
+            # Pasangan yang sudah mencapai daun disimpan lalu dibuang dari iterasi berikutnya
+            moving = step != node
+            if active is None:
+                leaves, active = step.astype(np.intp), np.flatnonzero(moving)
+            else:
+                leaves[active] = step
+                active = active[moving]
+            node, base = step[moving].astype(np.intp), base[moving]
+            if not len(node):
+                break
+        if active is None:
+            return node.reshape(n_rows, n_trees)
+        leaves[active] = node
+        return leaves.reshape(n_rows, n_trees)
+
+    def _block_proba(self, X):
+        # Imputasi dan normalisasi dengan urutan operasi yang sama seperti preprocessor,
+        # lalu dibulatkan ke float32 seperti input pohon scikit-learn
+        X = np.asarray(X, dtype=np.float64)
+        if self.fill is not None:
+            X = _impute(X, self.fill, self.zero_missing)
+        Xs = ((X - self.mean) / self.scale).astype(np.float32)
+        leaves = self._leaves(Xs)
+        proba = np.zeros((len(Xs), self.leaf_proba.shape[1]))
+        # Dijumlahkan pohon demi pohon agar pembulatannya sama dengan scikit-learn
+        for t in range(leaves.shape[1]):
+            proba += self.leaf_proba[leaves[:, t]]
+        proba /= leaves.shape[1]
+        return proba
+
+    def predict_proba_all(self, X, block_rows=DEFAULT_FOREST_BLOCK_ROWS, n_threads=1):
+        """Probabilitas semua kelas, setara `model.predict_proba(preprocessor.transform(X))`.
+
+        Baris diproses per blok `block_rows`; dengan `n_threads` > 1 blok-blok dihitung
+        paralel di thread pool (operasi NumPy melepas GIL).
+        """
+        X = np.asarray(X)
+        if len(X) <= block_rows:
+            return self._block_proba(X)
+        out = np.empty((len(X), self.leaf_proba.shape[1]))
+        starts = range(0, len(X), block_rows)
+
+        def run(start):
+            out[start:start + block_rows] = self._block_proba(X[start:start + block_rows])
+
+        if n_threads > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                list(executor.map(run, starts))
+        else:
+            for start in starts:
+                run(start)
+        return out
+
+    def predict_proba(self, X, block_rows=DEFAULT_FOREST_BLOCK_ROWS, n_threads=1):
+        """Probabilitas diabetes (kelas 1) untuk setiap baris, setara `predict_proba(...)[:, 1]`."""
+        return self.predict_proba_all(X, block_rows, n_threads)[:, 1]
+
+    def predict(self, X, block_rows=DEFAULT_FOREST_BLOCK_ROWS, n_threads=1):
+        return self.classes.take(np.argmax(self.predict_proba_all(X, block_rows, n_threads), axis=1))
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""Server HTTP lokal untuk prediksi diabetes dengan micro-batching permintaan.
+
+Scaler dan Logistic Regression (terlipat) dimuat sekali dari artefak (`scorer.npz`).
+Permintaan satu pasien yang datang bersamaan dikumpulkan dalam jendela waktu
+singkat lalu dihitung sekaligus dengan NumPy. Hanya memakai pustaka standar
+(asyncio) dan NumPy.
+
+Endpoint:
+    POST /predict  body JSON {"Pregnancies": 6, "Glucose": 148, ...} atau {"features": [8 nilai]}
+    GET  /metrics  latensi p50/p99, throughput dan ukuran batch rata-rata
+    GET  /health
+
+Contoh penggunaan:
+    python serve.py --port 8000 --batch-window-ms 2
+    curl -X POST localhost:8000/predict -d '{"features": [6, 148, 72, 35, 0, 33.6, 0.627, 50]}'
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+from artifacts import DEFAULT_ARTIFACT_DIR, load_manifest, load_scorer
+from scoring import risk_flags
+
+MAX_BODY_BYTES = 64 * 1024
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+class ServiceMetrics:
+    """Latensi per permintaan (jendela terbatas) dan penghitung throughput."""
+
+    def __init__(self, window=10_000):
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+        self.batched_rows = 0
+        self.started = time.perf_counter()
+
+    def record_request(self, seconds):
+        self.requests += 1
+        self.latencies.append(seconds)
+
+    def record_batch(self, size):
+        self.batches += 1
+        self.batched_rows += size
+
+    def snapshot(self):
+        uptime = time.perf_counter() - self.started
+        data = {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": self.batched_rows / self.batches if self.batches else 0.0,
+            "uptime_s": uptime,
+            "throughput_rps": self.requests / uptime if uptime > 0 else 0.0,
+            "p50_ms": None,
+            "p99_ms": None,
+        }
+        if self.latencies:
+            p50, p99 = np.percentile(np.fromiter(self.latencies, dtype=np.float64), [50, 99]) * 1000
+            data.update(p50_ms=p50, p99_ms=p99)
+        return data
+
+
+class MicroBatcher:
+    """Mengumpulkan permintaan satu baris menjadi batch kecil sebelum diprediksi.
+
+    Batch diproses saat `max_batch_size` tercapai atau `window` detik berlalu sejak
+    permintaan pertama dalam batch masuk.
+    """
+
+    def __init__(self, scorer, metrics, window=0.002, max_batch_size=64):
+        self.scorer = scorer
+        self.metrics = metrics
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, features):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((features, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._score(batch)
+
+    def _score(self, batch):
+        X = np.array([features for features, _ in batch], dtype=np.float64)
+        probability = self.scorer.predict_proba(X)
+        flags = risk_flags(X)
+        self.metrics.record_batch(len(batch))
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            future.set_result({
+                "prediction": int(probability[i] > 0.5),
+                "probability": float(probability[i]),
+                "risk": {name: bool(mask[i]) for name, mask in flags.items()},
+            })
+
+
+class PredictionServer:
+    def __init__(self, artifact_dir=DEFAULT_ARTIFACT_DIR, window=0.002, max_batch_size=64):
+        self.columns = load_manifest(artifact_dir)["columns"]
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(load_scorer(artifact_dir), self.metrics, window, max_batch_size)
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=8000):
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    def _parse_features(self, body):
+        payload = json.loads(body or b"{}")
+        if "features" in payload:
+            features = [float(v) for v in payload["features"]]
+        else:
+            features = [float(payload[col]) for col in self.columns]
+        if len(features) != len(self.columns):
+            raise ValueError(f"Dibutuhkan {len(self.columns)} nilai fitur: {self.columns}")
+        # NaN/inf akan diam-diam diisi imputasi, jadi ditolak di sini
+        if not np.isfinite(features).all():
+            raise ValueError("Nilai fitur harus berupa angka berhingga (bukan NaN/inf)")
+        return features
+
+    async def _route(self, method, path, body):
+        if path == "/predict":
+            if method != "POST":
+                return 405, {"error": "Gunakan POST"}
+            try:
+                features = self._parse_features(body)
+            except (ValueError, KeyError, TypeError) as e:
+                return 400, {"error": f"Input tidak valid: {e}"}
+            return 200, await self.batcher.submit(features)
+        if path == "/metrics":
+            return 200, self.metrics.snapshot()
+        if path == "/health":
+            return 200, {"status": "ok"}
+        return 404, {"error": "Endpoint tidak ditemukan"}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+        await writer.drain()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                headers = {}
+                try:
+                    # ValueError juga muncul dari readline jika baris melebihi batas buffer
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    start = time.perf_counter()
+                    method, path, version = request_line.decode("latin-1").split()
+                    while True:
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""):
+                            break
+                        key, _, value = line.decode("latin-1").partition(":")
+                        headers[key.strip().lower()] = value.strip()
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError("Content-Length negatif")
+                except ValueError as e:
+                    # Request line atau header rusak: balas 400 lalu tutup koneksi
+                    await self._respond(writer, 400, {"error": f"Permintaan HTTP tidak valid: {e}"}, False)
+                    break
+
+                if length > MAX_BODY_BYTES:
+                    status, payload = 413, {"error": "Body terlalu besar"}
+                    body = None
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self._route(method, path.split("?")[0], body)
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                await self._respond(writer, status, payload, keep_alive)
+                if path.startswith("/predict") and status == 200:
+                    self.metrics.record_request(time.perf_counter() - start)
+                if not keep_alive or body is None:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(artifact_dir, host, port, window, max_batch_size):
+    server = PredictionServer(artifact_dir, window, max_batch_size)
+    await server.start(host, port)
+    print(f"Server prediksi berjalan di http://{host}:{port} (jendela batch {window * 1000:.1f} ms)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server HTTP lokal untuk prediksi diabetes.")
+    parser.add_argument("--artifact", default=DEFAULT_ARTIFACT_DIR, help="Direktori artefak dari train.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--batch-window-ms", type=float, default=2.0,
+                        help="Lama menunggu permintaan lain sebelum batch diproses")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.artifact, args.host, args.port, args.batch_window_ms / 1000, args.max_batch_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""Pembacaan dataset secara streaming dengan skema tipe data ringkas.
+
+File CSV dibaca per chunk berukuran tetap sehingga pemakaian memori tidak
+bergantung pada ukuran file. Statistik deskriptif, jumlah nilai kosong,
+kuantil dan matriks korelasi dihitung bertahap dari setiap chunk lalu
+digabungkan, sehingga dapat juga dijalankan di beberapa worker.
+
+Contoh penggunaan:
+    python streaming.py data_besar.csv --chunk-size 200000
+"""
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+from schema import ALL_COLUMNS, DTYPES
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def read_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, usecols=None):
+    """Membaca CSV per chunk dengan tipe data sesuai `DTYPES`."""
+    columns = usecols or ALL_COLUMNS
+    dtype = {col: DTYPES[col] for col in columns}
+    return pd.read_csv(path, usecols=columns, dtype=dtype, chunksize=chunk_size)
+
+
+def load_dataset(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Memuat seluruh dataset ke memori dengan tipe data ringkas (untuk dataset yang muat di memori)."""
+    return pd.concat(read_chunks(path, chunk_size), ignore_index=True)
+
+
+class QuantileSketch:
+    """Sketsa kuantil aproksimatif (gaya KLL) untuk beberapa kolom sekaligus.
+
+    Item disimpan per level; level `i` mewakili 2**i baris asli. Jika sebuah level
+    melebihi `capacity`, item diurutkan per kolom dan setiap item kedua dinaikkan
+    ke level berikutnya. Memori tumbuh logaritmik terhadap jumlah baris dan dua
+    sketsa dapat digabung dengan `merge`.
+    """
+
+    def __init__(self, n_columns, capacity=2048):
+        self.n_columns = n_columns
+        self.capacity = capacity
+        self.levels = []
+        self._offset = 0
+
+    def update(self, values):
+        self._push(0, np.asarray(values, dtype=np.float64))
+        return self
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            self._push(level, items)
+        return self
+
+    def _push(self, level, items):
+        while len(self.levels) <= level:
+            self.levels.append(np.empty((0, self.n_columns)))
+        self.levels[level] = np.concatenate([self.levels[level], items])
+        while len(self.levels[level]) > self.capacity:
+            items = np.sort(self.levels[level], axis=0)
+            if len(items) % 2:
+                # Satu item disisakan agar jumlah item yang dipadatkan genap
+                self.levels[level], items = items[-1:], items[:-1]
+            else:
+                self.levels[level] = items[:0]
+            self._offset ^= 1
+            promoted = items[self._offset::2]
+            if len(self.levels) <= level + 1:
+                self.levels.append(np.empty((0, self.n_columns)))
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, qs):
+        """Mengembalikan array (len(qs), n_columns) berisi kuantil per kolom."""
+        qs = np.asarray(qs, dtype=np.float64)
+        if len(self.levels) <= 1:
+            # Belum ada pemadatan: kuantil eksak dengan interpolasi linear seperti pandas
+            items = self.levels[0] if self.levels else np.empty((0, self.n_columns))
+            if len(items) == 0:
+                return np.full((len(qs), self.n_columns), np.nan)
+            return np.nanquantile(items, qs, axis=0)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lv), 2.0 ** i) for i, lv in enumerate(self.levels)])
+        result = np.full((len(qs), self.n_columns), np.nan)
+        for j in range(self.n_columns):
+            column = items[:, j]
+            valid = ~np.isnan(column)
+            if not valid.any():
+                continue
+            order = np.argsort(column[valid], kind="stable")
+            values = column[valid][order]
+            cum = np.cumsum(weights[valid][order])
+            ranks = qs * (cum[-1] - 1)
+            result[:, j] = values[np.minimum(np.searchsorted(cum, ranks, side="right"), len(values) - 1)]
+        return result
+
+
+class RunningSummary:
+    """Statistik per kolom yang diperbarui per chunk dalam satu kali baca.
+
+    Menyimpan count, mean, std, min, max dan jumlah null per kolom, matriks
+    ko-momen untuk kovarians/korelasi Pearson, serta sketsa kuantil. Mean,
+    varians dan ko-momen digabung dengan rumus paralel Chan et al. sehingga
+    stabil secara numerik, dan ringkasan dari chunk atau worker berbeda dapat
+    digabung dengan `merge`. Memori O(kolom^2), tidak bergantung jumlah baris.
+
+    Kovarians dihitung dari baris yang lengkap (tanpa null) pada semua kolom.
+    """
+
+    def __init__(self, columns=None, sketch_capacity=2048):
+        self.columns = list(columns or ALL_COLUMNS)
+        k = len(self.columns)
+        self.rows = 0
+        self.count = np.zeros(k)
+        self.nulls = np.zeros(k, dtype=np.int64)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        # Statistik baris lengkap untuk matriks kovarians
+        self.complete = 0
+        self.complete_mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        self.sketch = QuantileSketch(k, sketch_capacity)
+
+    def update(self, chunk):
+        values = chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = np.isnan(values)
+        other = RunningSummary(self.columns, self.sketch.capacity)
+        other.rows = len(values)
+        other.nulls = mask.sum(axis=0)
+        other.count = (len(values) - other.nulls).astype(np.float64)
+
+        valid = other.count > 0
+        filled = np.where(mask, 0.0, values)
+        other.mean = np.divide(filled.sum(axis=0), other.count, out=np.zeros_like(other.count), where=valid)
+        other.m2 = (np.where(mask, 0.0, values - other.mean) ** 2).sum(axis=0)
+        other.min = np.where(mask, np.inf, values).min(axis=0, initial=np.inf)
+        other.max = np.where(mask, -np.inf, values).max(axis=0, initial=-np.inf)
+
+        complete = values[~mask.any(axis=1)]
+        other.complete = len(complete)
+        if other.complete:
+            other.complete_mean = complete.mean(axis=0)
+            centered = complete - other.complete_mean
+            other.comoment = centered.T @ centered
+
+        other.sketch.update(values)
+        return self.merge(other)
+
+    def merge(self, other):
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        ratio = np.divide(other.count, n, out=np.zeros_like(n), where=n > 0)
+        self.mean = self.mean + delta * ratio
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * ratio
+        self.count = n
+        self.rows += other.rows
+        self.nulls = self.nulls + other.nulls
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+        n = self.complete + other.complete
+        if other.complete:
+            delta = other.complete_mean - self.complete_mean
+            self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * self.complete * other.complete / n
+            self.complete_mean = self.complete_mean + delta * other.complete / n
+            self.complete = n
+
+        self.sketch.merge(other.sketch)
+        return self
+
+    def describe(self):
+        """Tabel setara `df.describe()`; kuartil berasal dari sketsa kuantil."""
+        std = np.sqrt(np.divide(self.m2, self.count - 1, out=np.full_like(self.m2, np.nan), where=self.count > 1))
+        empty = self.count == 0
+        q25, q50, q75 = self.sketch.quantiles([0.25, 0.5, 0.75])
+        table = {
+            'count': self.count,
+            'mean': np.where(empty, np.nan, self.mean),
+            'std': std,
+            'min': np.where(empty, np.nan, self.min),
+            '25%': q25,
+            '50%': q50,
+            '75%': q75,
+            'max': np.where(empty, np.nan, self.max),
+        }
+        return pd.DataFrame(table, index=self.columns).T
+
+    def null_counts(self):
+        """Jumlah nilai kosong per kolom, setara `df.isnull().sum()`."""
+        return pd.Series(self.nulls, index=self.columns)
+
+    def cov(self):
+        """Matriks kovarians sampel, setara `df.cov()` untuk data tanpa null."""
+        cov = self.comoment / (self.complete - 1) if self.complete > 1 else np.full_like(self.comoment, np.nan)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def corr(self):
+        """Matriks korelasi Pearson, setara `df.corr()` untuk data tanpa null."""
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoment / np.outer(std, std)
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return pd.DataFrame(np.clip(corr, -1, 1), index=self.columns, columns=self.columns)
+
+
+def _summarize_chunk(chunk):
+    return RunningSummary().update(chunk)
+
+
+def summarize_csv(path, chunk_size=DEFAULT_CHUNK_SIZE, n_workers=1):
+    """Menghitung `RunningSummary` dari file CSV dalam satu kali baca per chunk.
+
+    Jika `n_workers` > 1, chunk diringkas paralel di process pool lalu hasilnya
+    digabung. Jumlah chunk yang sedang diproses dibatasi agar memori tetap terbatas.
+    """
+    summary = RunningSummary()
+    if n_workers <= 1:
+        for chunk in read_chunks(path, chunk_size):
+            summary.update(chunk)
+        return summary
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = set()
+        for chunk in read_chunks(path, chunk_size):
+            if len(pending) >= 2 * n_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    summary.merge(future.result())
+            pending.add(executor.submit(_summarize_chunk, chunk))
+        for future in pending:
+            summary.merge(future.result())
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ringkasan statistik dataset secara streaming.")
+    parser.add_argument("path", help="File CSV dataset")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah proses untuk meringkas chunk")
+    args = parser.parse_args()
+
+    summary = summarize_csv(args.path, args.chunk_size, args.workers)
+    print(f"Jumlah baris: {summary.rows}")
+    print("\nTipe data:")
+    print(pd.Series(DTYPES))
+    print("\nStatistik deskriptif:")
+    print(summary.describe())
+    print("\nJumlah nilai kosong:")
+    print(summary.null_counts())
+    print("\nMatriks korelasi:")
+    print(summary.corr().round(2))
+
+
+if __name__ == "__main__":
+    main()
@@ -38,9 +38,13 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
+import time
+
+from dedup import Deduplicator
+from preprocessing import build_preprocessor
+from streaming import RunningSummary, read_chunks
 
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix
 from sklearn.ensemble import RandomForestClassifier
@@ -56,15 +60,32 @@ Pada bagian ini, kita mengimpor berbagai library yang diperlukan untuk menjalank
 
 Dari *scikit-learn*, kita menggunakan:
 - **train_test_split**: Untuk membagi data menjadi data latih dan data uji.
-- **StandardScaler**: Untuk menstandarkan nilai fitur numerik agar berada pada skala yang sama.
+- **build_preprocessor** (modul `preprocessing.py`): Pipeline preprocessing yang mengganti nilai 0 yang tidak valid dengan median lalu menstandarkan fitur numerik dengan `StandardScaler`.
 - **LogisticRegression, RandomForestClassifier, SVC**: Algoritma yang digunakan untuk membuat model klasifikasi.
 - **accuracy_score, precision_score, recall_score, f1_score, confusion_matrix**: Digunakan untuk mengukur dan mengevaluasi performa model klasifikasi.
 """
 
-# Load the dataset
-df = pd.read_csv('dataset.csv')
-
-df.info()
+# Load the dataset: satu kali baca per chunk dengan skema tipe data ringkas.
+# Info, statistik deskriptif, nilai kosong, korelasi dan duplikat dihitung bertahap
+# dari chunk yang sama, tanpa memeriksa seluruh data sekaligus.
+summary = RunningSummary()
+dedup = Deduplicator()
+chunks = []
+duplikat = []
+memory_bytes = 0
+for chunk in read_chunks('dataset.csv'):
+    summary.update(chunk)
+    in_batch, cross = dedup.check(chunk)
+    duplikat.append(chunk[in_batch | cross])
+    memory_bytes += chunk.memory_usage(index=False).sum()
+    # Chunk bertipe ringkas disimpan untuk visualisasi dan pemodelan yang membutuhkan semua baris
+    chunks.append(chunk)
+df = pd.concat(chunks, ignore_index=True)
+del chunks
+
+# Informasi dataset (setara df.info())
+print(f"Jumlah baris: {summary.rows} | Jumlah kolom: {len(summary.columns)} | Memori: {memory_bytes / 1024:.1f} KB")
+pd.DataFrame({'Non-Null Count': summary.rows - summary.null_counts(), 'Dtype': df.dtypes})
 
 """Informasi Dataset
 
@@ -98,8 +119,8 @@ Sebagai contoh:
 Melalui data ini, kita dapat memahami bagaimana setiap fitur atau variabel dalam dataset berperan dalam proses analisis dan prediksi diabetes pada pasien.
 """
 
-# Statistik deskriptif
-df.describe()
+# Statistik deskriptif (dihitung bertahap per chunk)
+summary.describe()
 
 """Statistik Deskriptif
 
@@ -113,7 +134,7 @@ Dari temuan ini, dapat disimpulkan bahwa beberapa fitur memiliki rentang nilai y
 """
 
 # Mengecek value yang hilang
-df.isnull().sum()
+summary.null_counts()
 
 """Pemeriksaan Data Kosong (Missing Values)
 
@@ -122,12 +143,12 @@ Setelah dilakukan pengecekan terhadap data, dapat dipastikan bahwa seluruh kolom
 Tidak ada missing values dalam dataset ini, seperti yang telah diverifikasi sebelumnya. Semua kolom memiliki 768 entri non-null.
 """
 
-#  data duplikat
-jumlah_duplikat = df.duplicated().sum()
+#  data duplikat (hash baris per chunk, setara df.duplicated())
+jumlah_duplikat = dedup.duplicates
 print(f"Jumlah baris duplikat: {jumlah_duplikat}")
 
 # Menampilkan baris  duplikat
-duplikat = df[df.duplicated()]
+duplikat = pd.concat(duplikat)
 print("Baris duplikat:")
 print(duplikat)
 
@@ -175,9 +196,9 @@ plt.show()
 
 """
 
-# Korelasi antar fitur
+# Korelasi antar fitur (dari ringkasan streaming, tanpa membaca ulang data)
 plt.figure(figsize=(10, 8))
-sns.heatmap(df.corr(), annot=True, cmap="coolwarm", fmt=".2f")
+sns.heatmap(summary.corr(), annot=True, cmap="coolwarm", fmt=".2f")
 plt.title("Matriks Korelasi Fitur")
 plt.show()
 
@@ -194,59 +215,40 @@ plt.show()
 - Sementara itu, sebagian besar fitur lain dalam dataset ini tidak saling berhubungan secara kuat (nilai korelasinya rendah satu sama lain). Hal ini menunjukkan bahwa setiap fitur membawa informasi yang berbeda dan tidak terjadi tumpang tindih data (multikolinearitas rendah), sehingga seluruh fitur tetap penting untuk dianalisis secara terpisah.
 """
 
-scaler = StandardScaler()
-
-"""Setelah proses normalisasi, seluruh fitur numerik pada data diubah sehingga memiliki rata-rata (mean) 0 dan standar deviasi 1. Langkah ini sangat penting karena membuat semua fitur berada pada skala yang sama, sehingga tidak ada fitur yang mendominasi proses pelatihan model hanya karena rentang nilainya lebih besar. Normalisasi sangat membantu terutama untuk algoritma machine learning yang sensitif terhadap perbedaan skala, seperti **Logistic Regression** atau **K-Nearest Neighbors**. Dengan data yang sudah dinormalisasi, model dapat belajar pola dari data secara lebih adil dan akurat, sehingga hasil prediksi yang dihasilkan pun menjadi lebih optimal."""
-
 # Kolompokkan fitur dan target
-features = df.drop(columns=['Outcome'])
+features = df.drop(columns=['Outcome']).astype('float64')
+target = df['Outcome'].astype('int64')
 
 """Seleksi Fitur
 
-Memisahkan kolom fitur dari target (`Outcome`) agar dapat dilakukan proses normalisasi hanya pada fitur input.
+Memisahkan kolom fitur dari target (`Outcome`). Fitur diubah ke float64 sehingga nilai kosong menjadi NaN.
 """
 
-# Normalisasi features
-scaled_features = scaler.fit_transform(features)
-
-"""Normalisasi Fitur
-
-Melakukan standardisasi fitur numerik menggunakan `StandardScaler` agar semua fitur berada dalam skala yang sama (mean = 0, std = 1).
-"""
+# Membagi data menjadi 80% training dan 20% test, sebelum preprocessing
+X_train_raw, X_test_raw, y_train, y_test = train_test_split(features, target, test_size=0.2, random_state=42)
 
-# Menyusun DataFrame baru setelah normalisasi
-scaled_df = pd.DataFrame(scaled_features, columns=features.columns)
-
-"""Menyusun DataFrame Ternormalisasi
-
-Mengubah hasil normalisasi (array) menjadi DataFrame dengan kolom yang sama seperti fitur asli.
-"""
-
-# Menambahkan kolom target 'Outcome'
-scaled_df['Outcome'] = df['Outcome']
-
-"""Menambahkan Kolom Target
-
-Menambahkan kembali kolom `Outcome` (target klasifikasi) ke dalam DataFrame yang sudah dinormalisasi.
-"""
+"""Dataset dibagi menjadi 80% data latih dan 20% data uji. Data latih digunakan untuk membangun model, sementara data uji digunakan untuk mengevaluasi kinerja model. Pembagian dilakukan **sebelum** normalisasi, sehingga statistik data uji tidak ikut dipakai saat preprocessing dan data uji benar-benar belum pernah dilihat oleh model."""
 
-scaled_df.head()
+# Preprocessing: nilai 0 yang tidak valid -> kosong, imputasi median, lalu standardisasi
+scaler = build_preprocessor()
+X_train = pd.DataFrame(scaler.fit_transform(X_train_raw), columns=features.columns, index=X_train_raw.index)
+X_test = pd.DataFrame(scaler.transform(X_test_raw), columns=features.columns, index=X_test_raw.index)
 
-"""Setelah normalisasi menggunakan **StandardScaler**, semua fitur numerik dalam dataset, seperti **Glucose**, **Insulin**, dan **BMI**, kini berada dalam rentang yang lebih seragam dengan nilai rata-rata 0 koma sekian dan standar deviasi 1. Proses ini memastikan bahwa fitur yang sebelumnya memiliki skala yang sangat bervariasi kini berada pada skala yang konsisten, sehingga model machine learning dapat memproses data dengan lebih efisien tanpa terpengaruh oleh perbedaan skala antar fitur. Kolom target **Outcome** tetap berada pada nilai asli (0 atau 1), karena ini adalah variabel kategorikal."""
+"""Preprocessing dan Normalisasi Fitur
 
-# Pemisahan Data menjadi Training dan Test Set
-X = scaled_df.drop(columns=['Outcome'])  # Fitur
-y = scaled_df['Outcome']  # Target
+Preprocessing memakai pipeline yang sama dengan `train.py` (`preprocessing.build_preprocessor`):
+- nilai 0 pada **Glucose**, **BloodPressure**, **SkinThickness**, **Insulin** dan **BMI** dianggap data kosong, karena secara medis tidak mungkin bernilai 0;
+- nilai kosong diisi dengan median kolom;
+- seluruh fitur distandardisasi dengan `StandardScaler` (mean = 0, std = 1).
 
-"""Pemisahan Fitur dan Target
+Pipeline hanya di-fit pada data latih (`fit_transform(X_train_raw)`), lalu data uji cukup ditransformasi (`transform(X_test_raw)`). Dengan begitu median, mean dan standar deviasi yang dipakai tidak mengandung informasi dari data uji.
 
-Memisahkan variabel fitur (`X`) dan target (`y`) dari DataFrame yang sudah dinormalisasi untuk persiapan training dan evaluasi model.
+Normalisasi membuat semua fitur berada pada skala yang sama, sehingga tidak ada fitur yang mendominasi proses pelatihan model hanya karena rentang nilainya lebih besar. Hal ini sangat membantu terutama untuk algoritma yang sensitif terhadap perbedaan skala, seperti **Logistic Regression** atau **SVM**.
 """
 
-# Membagi data menjadi 80% training dan 20% test
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+X_train.head()
 
-"""Dataset dibagi menjadi 80% data latih dan 20% data uji. Data latih digunakan untuk membangun model, sementara data uji digunakan untuk mengevaluasi kinerja model. Pembagian ini memastikan bahwa model dapat diuji dengan data yang tidak pernah dilihat sebelumnya, memberikan gambaran yang lebih akurat tentang kemampuan generalisasi model."""
+"""Setelah preprocessing, semua fitur numerik pada data latih, seperti **Glucose**, **Insulin**, dan **BMI**, berada dalam rentang yang seragam dengan rata-rata 0 dan standar deviasi 1. Kolom target **Outcome** tetap berada pada nilai asli (0 atau 1), karena ini adalah variabel kategorikal."""
 
 # Menampilkan ukuran data latih dan data uji
 print(f"Ukuran data latih: {X_train.shape[0]} | Ukuran data uji: {X_test.shape[0]}")
@@ -379,29 +381,31 @@ Setelah melatih ketiga model — **Logistic Regression**, **Random Forest**, dan
 
 | Model               | Accuracy | Precision | Recall | F1-Score |
 |---------------------|----------|-----------|--------|----------|
-| Logistic Regression | **0.753** | **0.649**   | **0.673** | **0.661**  |
-| Random Forest       | 0.727    | 0.618     | 0.618  | 0.618    |
-| SVM                 | 0.727    | 0.633     | 0.564  | 0.596    |
+| Logistic Regression | **0.753** | **0.667**   | 0.618  | 0.642    |
+| Random Forest       | 0.740    | 0.623     | **0.691** | **0.655**  |
+| SVM                 | 0.747    | **0.667**   | 0.582  | 0.621    |
+
+Angka di atas berasal dari preprocessing yang hanya di-fit pada data latih (nilai 0 yang tidak valid diimputasi median). Versi sebelumnya menormalisasi seluruh 768 baris sebelum pembagian data, sehingga statistik data uji ikut bocor ke preprocessing dan hasilnya tidak dapat dibandingkan langsung dengan tabel ini.
 
 **Interpretasi Hasil**
 
-- **Logistic Regression** menunjukkan performa terbaik di antara ketiga model pada semua metrik evaluasi utama. Model ini mencapai **akurasi tertinggi sebesar 75.32%**, serta memiliki **precision, recall, dan F1-score** yang lebih baik dibandingkan Random Forest dan SVM.
-- Model ini memiliki **64.91% precision**, yang berarti sekitar 65% dari semua kasus yang diprediksi sebagai diabetes benar-benar positif.
-- Dengan **67.27% recall**, model berhasil mendeteksi sebagian besar pasien yang benar-benar mengidap diabetes.
-- F1-score sebesar **66.07%** mengindikasikan keseimbangan yang baik antara precision dan recall.
+- **Logistic Regression** mencapai **akurasi tertinggi sebesar 75.32%** dan **precision 66.67%** (sama dengan SVM), yang berarti sekitar 67% dari semua kasus yang diprediksi sebagai diabetes benar-benar positif.
+- **Random Forest** memiliki **recall tertinggi (69.09%)** dan **F1-score tertinggi (65.52%)**, sehingga paling banyak menemukan pasien yang benar-benar mengidap diabetes, dengan precision yang sedikit lebih rendah (62.30%).
+- **SVM** memiliki akurasi 74.68% dan precision yang sama dengan Logistic Regression, tetapi recall-nya paling rendah (58.18%).
+- Selisih antar-model kecil (sekitar 1–2 poin persentase) untuk data uji berukuran 154 baris; lihat selang kepercayaan bootstrap dari `python train.py` sebelum menyimpulkan bahwa satu model benar-benar lebih baik.
 
 **Confusion Matrix**
 
 Model Logistic Regression menghasilkan confusion matrix sebagai berikut:
 
-- **Benar Negatif (True Negative)**: 79 kasus tidak diabetes diklasifikasikan dengan benar.
-- **Benar Positif (True Positive)**: 37 kasus diabetes diklasifikasikan dengan benar.
-- **False Positive**: 20 kasus tidak diabetes yang salah diklasifikasikan sebagai diabetes.
-- **False Negative**: 18 kasus diabetes yang salah diklasifikasikan sebagai tidak diabetes.
+- **Benar Negatif (True Negative)**: 82 kasus tidak diabetes diklasifikasikan dengan benar.
+- **Benar Positif (True Positive)**: 34 kasus diabetes diklasifikasikan dengan benar.
+- **False Positive**: 17 kasus tidak diabetes yang salah diklasifikasikan sebagai diabetes.
+- **False Negative**: 21 kasus diabetes yang salah diklasifikasikan sebagai tidak diabetes.
 
 **Kesimpulan**
 
-Berdasarkan hasil evaluasi, **Logistic Regression dipilih sebagai model terbaik** untuk kasus ini karena memiliki performa paling seimbang dan konsisten di seluruh metrik. Meskipun masih ada ruang untuk perbaikan, terutama dalam hal false negative, model ini memberikan dasar yang kuat dan dapat ditingkatkan lebih lanjut dengan teknik tuning atau ensemble di masa depan.
+Berdasarkan hasil evaluasi, **Logistic Regression dipilih sebagai model utama** untuk kasus ini karena memiliki akurasi dan precision tertinggi, performanya sebanding dengan model lain, serta sederhana dan mudah diinterpretasikan. Jika mendeteksi sebanyak mungkin pasien diabetes (recall) lebih diutamakan, Random Forest layak dipertimbangkan karena false negative-nya lebih sedikit (17 dibanding 21). Model ini masih dapat ditingkatkan lebih lanjut dengan teknik tuning, penyesuaian threshold atau ensemble di masa depan.
 """
 
 # ========================
@@ -482,6 +486,31 @@ for i, feature in enumerate(columns):
 plt.tight_layout()
 plt.show()
 
+# ========================
+# Prediksi Batch untuk Banyak Pasien
+# ========================
+
+from batch_scoring import score_batch
+
+# Membuat data banyak pasien sekaligus dengan rentang nilai yang sama
+batch_data = np.random.randint(
+    [0, 50, 50, 10, 10, 18, 0, 18],
+    [15, 200, 120, 80, 300, 50, 2, 80],
+    size=(100_000, 8)
+)
+
+start = time.perf_counter()
+batch_result = score_batch(batch_data, scaler, best_model)
+elapsed = time.perf_counter() - start
+
+print(batch_result.head())
+print(f"Jumlah pasien: {len(batch_result)} | {len(batch_result) / elapsed:,.0f} baris/detik")
+
+"""Prediksi Batch
+
+Untuk memprediksi banyak pasien sekaligus, digunakan fungsi `score_batch` dari modul `batch_scoring.py`. Data diproses per chunk besar secara tervektorisasi: normalisasi dengan `scaler` yang sama, prediksi dengan model Logistic Regression, lalu indikator risiko (Glucose > 140, BMI > 30, Age > 45, DiabetesPedigreeFunction > 0.5) dihitung sebagai kolom boolean tanpa perulangan per baris. Hasilnya berupa satu tabel berisi prediksi, probabilitas diabetes, dan flag risiko untuk setiap pasien. File CSV berukuran besar dapat diproses langsung dengan `python batch_scoring.py pasien.csv --output hasil.csv`.
+"""
+
 """### Insight
 
 Model yang digunakan dalam analisis ini mampu mengidentifikasi kemungkinan **diabetes** pada pasien berdasarkan data medis yang diberikan. Pada contoh prediksi ini, model memperkirakan bahwa individu tersebut memiliki peluang sebesar **87,90%** untuk terdiagnosis **diabetes** (**Prediksi: Diabetes**), yang menunjukkan tingkat keyakinan model yang cukup tinggi terhadap hasil tersebut.
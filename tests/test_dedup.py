@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Jumlah duplikat dari `Deduplicator` harus sama dengan `DataFrame.duplicated()`."""
+
+import numpy as np
+import pandas as pd
+
+from dedup import Deduplicator
+
+
+def _with_duplicates(df):
+    rng = np.random.default_rng(0)
+    copies = df.iloc[rng.integers(0, len(df), 200)].copy()
+    # Nilai kosong harus dianggap sama satu sama lain, seperti pada duplicated()
+    copies.iloc[:50, 4] = pd.NA
+    return pd.concat([df, copies, copies.iloc[:50]], ignore_index=True).sample(frac=1, random_state=0)
+
+
+def test_single_chunk_matches_duplicated(dataset):
+    in_batch, cross = Deduplicator().check(dataset)
+    np.testing.assert_array_equal(in_batch, dataset.duplicated().to_numpy())
+    assert not cross.any()
+
+
+def test_chunks_match_duplicated(dataset):
+    df = _with_duplicates(dataset)
+    dedup = Deduplicator()
+    # Semua chunk sebelum commit() adalah satu batch, jadi duplikat antar-chunk masuk "dalam batch"
+    masks = [dedup.check(df.iloc[start:start + 97])[0] for start in range(0, len(df), 97)]
+    np.testing.assert_array_equal(np.concatenate(masks), df.duplicated().to_numpy())
+    assert dedup.duplicates == df.duplicated().sum()
+
+
+def test_batches_match_duplicated(dataset, tmp_path):
+    df = _with_duplicates(dataset)
+    first, second = df.iloc[:600], df.iloc[600:]
+    dedup = Deduplicator(str(tmp_path))
+    dedup.check(first)
+    dedup.commit()
+
+    # Index dibaca ulang dari disk untuk batch kedua
+    dedup = Deduplicator(str(tmp_path))
+    in_batch, cross = dedup.check(second)
+    np.testing.assert_array_equal(in_batch | cross, df.duplicated().to_numpy()[600:])
+    assert dedup.duplicates == df.duplicated().iloc[600:].sum()
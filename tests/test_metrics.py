@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Kesetaraan metrik NumPy (`metrics.py`) dengan `sklearn.metrics` pada dataset.csv."""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (accuracy_score, average_precision_score, confusion_matrix, f1_score,
+                             precision_score, recall_score, roc_auc_score)
+
+from metrics import ThresholdCurve, confusion_counts, scores_from_confusion
+from pipeline import prepare_data
+
+
+@pytest.fixture(scope="module")
+def data(dataset):
+    _, X_train, X_test, y_train, y_test = prepare_data(dataset)
+    return X_train, X_test, y_train, y_test
+
+
+def test_metrics_match_sklearn(data):
+    X_train, X_test, y_train, y_test = data
+    model = LogisticRegression(random_state=42).fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    y_score = model.predict_proba(X_test)[:, 1]
+
+    cm = confusion_counts(y_test, y_pred)
+    np.testing.assert_array_equal(cm, confusion_matrix(y_test, y_pred))
+    expected = [accuracy_score(y_test, y_pred), precision_score(y_test, y_pred),
+                recall_score(y_test, y_pred), f1_score(y_test, y_pred)]
+    np.testing.assert_allclose(scores_from_confusion(cm), expected, rtol=1e-12)
+
+    curve = ThresholdCurve(y_test, y_score)
+    assert curve.roc_auc() == pytest.approx(roc_auc_score(y_test, y_score), rel=1e-12)
+    assert curve.average_precision() == pytest.approx(average_precision_score(y_test, y_score), rel=1e-12)
+
+
+def test_metrics_zero_division_matches_sklearn():
+    y_true = np.array([0, 0, 1, 1])
+    y_pred = np.zeros(4, dtype=int)
+    cm = confusion_counts(y_true, y_pred)
+    expected = [accuracy_score(y_true, y_pred), precision_score(y_true, y_pred, zero_division=0),
+                recall_score(y_true, y_pred), f1_score(y_true, y_pred, zero_division=0)]
+    assert scores_from_confusion(cm) == expected
+
+
+def test_threshold_curve_empty():
+    curve = ThresholdCurve([], [])
+    assert len(curve.thresholds) == 0 and curve.positives == 0 and curve.negatives == 0
+    assert np.isnan(curve.roc_auc())
+    with pytest.raises(ValueError):
+        curve.operating_point(0.5)
+
+
+def test_operating_point_validates_min_recall():
+    curve = ThresholdCurve([0, 1, 1, 0], [0.1, 0.8, 0.4, 0.3])
+    assert curve.operating_point(1.0)["Recall"] == 1.0
+    assert curve.operating_point(0.5)["Threshold"] == 0.8
+    for min_recall in (-0.1, 1.5):
+        with pytest.raises(ValueError):
+            curve.operating_point(min_recall)
+    with pytest.raises(ValueError):
+        ThresholdCurve([0, 0], [0.2, 0.7]).operating_point(0.5)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Kesetaraan `LinearScorer` dan `ForestScorer` dengan model scikit-learn pada dataset.csv."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from pipeline import prepare_data
+from schema import FEATURE_COLUMNS
+from scoring import ForestScorer, LinearScorer
+
+
+@pytest.fixture(scope="module")
+def prepared(dataset):
+    preprocessor, X_train, _, y_train, _ = prepare_data(dataset)
+    raw = dataset[FEATURE_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+    # Nilai kosong (NaN) dan nol yang dianggap kosong harus melewati imputasi yang sama dengan preprocessor
+    raw[::7, FEATURE_COLUMNS.index("Glucose")] = np.nan
+    raw[::11, FEATURE_COLUMNS.index("BMI")] = 0
+    return preprocessor, X_train, y_train, raw
+
+
+def test_linear_scorer_matches_sklearn(prepared, tmp_path):
+    preprocessor, X_train, y_train, raw = prepared
+    model = LogisticRegression(random_state=42).fit(X_train, y_train)
+    scorer = LinearScorer.from_sklearn(preprocessor, model)
+    expected = model.predict_proba(preprocessor.transform(raw))[:, 1]
+
+    np.testing.assert_allclose(scorer.predict_proba(raw), expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(scorer.predict_proba(raw, chunk_size=100), expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(scorer.predict(raw), model.predict(preprocessor.transform(raw)))
+
+    raw32 = raw.astype(np.float32)
+    np.testing.assert_allclose(scorer.predict_proba(raw32), expected, atol=1e-5)
+
+    np.save(tmp_path / "raw32.npy", raw32)
+    memmap = np.load(tmp_path / "raw32.npy", mmap_mode="r")
+    np.testing.assert_allclose(scorer.predict_proba(memmap, chunk_size=100), expected, atol=1e-5)
+
+
+def test_forest_scorer_matches_sklearn(prepared):
+    preprocessor, X_train, y_train, raw = prepared
+    model = RandomForestClassifier(n_estimators=50, random_state=42).fit(X_train, y_train)
+    scorer = ForestScorer.from_sklearn(preprocessor, model)
+
+    expected = model.predict_proba(preprocessor.transform(raw))
+    np.testing.assert_array_equal(scorer.predict_proba_all(raw), expected)
+    np.testing.assert_array_equal(scorer.predict_proba_all(raw, block_rows=100), expected)
+    np.testing.assert_array_equal(scorer.predict(raw), model.predict(preprocessor.transform(raw)))
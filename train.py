@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""Melatih seluruh model dan menyimpannya sebagai artefak untuk `predict.py`.
+
+Script ini berjalan tanpa tampilan (headless). Grafik EDA dan evaluasi tidak
+digambar kecuali diminta dengan `--plots files`, yang menyimpannya sebagai PNG.
+
+Contoh penggunaan:
+    python train.py --data dataset.csv --output artifacts/latest
+    python train.py --plots files --plots-dir figures --plot-workers 4
+    python train.py --svm both --svm-components 300
+    python train.py --min-recall 0.9 --curves-dir curves
+    python train.py --bootstrap 2000
+    python train.py --no-cache
+"""
+
+import argparse
+import os
+
+import pandas as pd
+
+import instrumentation
+from artifacts import DEFAULT_ARTIFACT_DIR, dataset_fingerprint, safe_filename, save_artifact
+from columnar import DEFAULT_DATA_CACHE_DIR, open_data
+from pipeline import (DEFAULT_NYSTROEM_COMPONENTS, MAX_EXACT_SVM_ROWS, METRIC_NAMES, build_models,
+                      fit_and_evaluate, load_data, prepare_data)
+from instrumentation import stage
+from metrics import bootstrap_ci
+from preprocessing import DEFAULT_CACHE_DIR
+from schema import ALL_COLUMNS, FEATURE_COLUMNS
+from streaming import RunningSummary
+
+
+def _interval_table(intervals):
+    """Tabel `estimasi [bawah, atas]` per baris dari hasil `metrics.bootstrap_ci`."""
+    return pd.DataFrame({
+        metric: {name: f"{ci[k, 0]:.3f} [{ci[k, 1]:.3f}, {ci[k, 2]:.3f}]" for name, ci in intervals.items()}
+        for k, metric in enumerate(METRIC_NAMES)
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latih model prediksi diabetes dan simpan artefaknya.")
+    parser.add_argument("--data", default="dataset.csv", help="File CSV data latih")
+    parser.add_argument("--output", default=DEFAULT_ARTIFACT_DIR, help="Direktori artefak")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Budget core untuk melatih model secara paralel (-1 = semua core)")
+    parser.add_argument("--svm", choices=["exact", "approx", "both"], default="exact",
+                        help="exact: SVC kernel RBF; approx: Nystroem + SGDClassifier (hinge); both: keduanya untuk dibandingkan")
+    parser.add_argument("--svm-components", type=int, default=DEFAULT_NYSTROEM_COMPONENTS,
+                        help="Ukuran peta fitur Nystroem untuk mode approx")
+    parser.add_argument("--max-exact-svm-rows", type=int, default=MAX_EXACT_SVM_ROWS,
+                        help="SVC eksak dilewati jika data latih lebih besar dari batas ini")
+    parser.add_argument("--min-recall", type=float, default=0.9,
+                        help="Recall minimal untuk memilih threshold operasi setiap model")
+    parser.add_argument("--curves-dir", help="Simpan tabel threshold setiap model sebagai CSV ke direktori ini")
+    parser.add_argument("--bootstrap", type=int, default=0,
+                        help="Jumlah resample bootstrap untuk selang kepercayaan 95%% metrik (0 = nonaktif)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="Direktori cache hasil preprocessing (kunci: fingerprint data + parameter)")
+    parser.add_argument("--data-cache-dir", default=DEFAULT_DATA_CACHE_DIR,
+                        help="Direktori cache kolumnar (.npy) data mentah, dibuka sebagai memmap")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Selalu baca CSV dan jalankan preprocessing tanpa cache")
+    parser.add_argument("--plots", choices=["skip", "files"], default="skip",
+                        help="skip: tanpa grafik; files: simpan grafik ke --plots-dir")
+    parser.add_argument("--plots-dir", default="figures", help="Direktori output grafik")
+    parser.add_argument("--plot-workers", type=int, default=1, help="Jumlah proses untuk menggambar grafik")
+    parser.add_argument("--trace", help="Catat metrik setiap tahapan sebagai JSON lines ke file ini ('-' = stderr)")
+    parser.add_argument("--trace-memory", action="store_true", help="Sertakan puncak memori per tahapan (tracemalloc)")
+    parser.add_argument("--profile-stage", help="Nama tahapan yang diprofilkan dengan cProfile, misalnya 'fit:SVM'")
+    args = parser.parse_args()
+    if not 0 <= args.min_recall <= 1:
+        parser.error("--min-recall harus di antara 0 dan 1")
+    instrumentation.configure(trace=args.trace, memory=args.trace_memory or None, profile_stage=args.profile_stage)
+
+    if args.no_cache:
+        df = load_data(args.data)
+        fingerprint, split = dataset_fingerprint(args.data), None
+    else:
+        with stage("load", source="columnar") as s:
+            data, _ = open_data(args.data, args.data_cache_dir)
+            df, fingerprint, split = data.frame(), data.fingerprint, data.split_indices()
+            s.rows = len(df)
+    with stage("data_understanding", rows=len(df)):
+        summary = RunningSummary().update(df)
+    print(f"Jumlah baris: {summary.rows} | Jumlah nilai kosong: {summary.null_counts().sum()}")
+
+    plot_tasks = []
+    if args.plots == "files":
+        import plots
+        plot_tasks += plots.eda_tasks(df[FEATURE_COLUMNS].to_numpy(dtype=float), FEATURE_COLUMNS,
+                                      summary.corr().to_numpy(), ALL_COLUMNS, args.plots_dir)
+
+    preprocessor, X_train, X_test, y_train, y_test = prepare_data(
+        df, cache_dir=None if args.no_cache else args.cache_dir, fingerprint=fingerprint["sha256"], split=split)
+    print(f"Ukuran data latih: {X_train.shape[0]} | Ukuran data uji: {X_test.shape[0]}")
+
+    models = build_models(args.svm, args.svm_components)
+    if "SVM" in models and len(X_train) > args.max_exact_svm_rows:
+        del models["SVM"]
+        print(f"SVC eksak dilewati: {len(X_train)} baris latih > {args.max_exact_svm_rows}. "
+              f"Gunakan --svm approx untuk data sebesar ini.")
+    results, conf_matrices, fit_times, curves, predictions = fit_and_evaluate(
+        models, X_train, y_train, X_test, y_test, n_jobs=args.jobs)
+
+    metrics_df = pd.DataFrame(results, index=METRIC_NAMES).T
+    metrics_df["ROC AUC"] = pd.Series({name: curve.roc_auc() for name, curve in curves.items()})
+    metrics_df["Average Precision"] = pd.Series({name: curve.average_precision() for name, curve in curves.items()})
+    metrics_df["Fit Time (s)"] = pd.Series(fit_times)
+    print("Evaluasi Metrik Setiap Model:")
+    print(metrics_df.to_string())
+
+    if args.bootstrap:
+        with stage("bootstrap", rows=len(y_test), resamples=args.bootstrap):
+            y_preds = {name: y_pred for name, (y_pred, _) in predictions.items()}
+            intervals, differences = bootstrap_ci(y_test, y_preds, args.bootstrap)
+        print(f"\nSelang Kepercayaan 95% (bootstrap, {args.bootstrap} resample):")
+        print(_interval_table(intervals).to_string())
+        print("\nSelisih Metrik Antar-Model (A - B):")
+        print(_interval_table({f"{a} - {b}": ci for (a, b), ci in differences.items()}).to_string())
+
+    # False negative paling dihindari: threshold tertinggi yang masih mencapai recall minimal
+    operating_points = {name: curve.operating_point(args.min_recall) for name, curve in curves.items()}
+    print(f"\nThreshold Operasi (Recall >= {args.min_recall}):")
+    print(pd.DataFrame.from_dict(operating_points, orient="index")
+          [["Threshold", "Precision", "Recall", "F1-Score", "FN", "FP"]].to_string())
+
+    if args.curves_dir:
+        os.makedirs(args.curves_dir, exist_ok=True)
+        for name, curve in curves.items():
+            path = os.path.join(args.curves_dir, f"threshold_{safe_filename(name)}.csv")
+            pd.DataFrame(curve.table()).to_csv(path, index=False)
+            print(f"Tabel threshold disimpan: {path}")
+
+    if args.plots == "files":
+        plot_tasks += plots.evaluation_tasks(results, conf_matrices, METRIC_NAMES, args.plots_dir, curves)
+        with stage("plotting", figures=len(plot_tasks)):
+            paths = plots.render(plot_tasks, args.plot_workers)
+        for path in paths:
+            print(f"Grafik disimpan: {path}")
+
+    metrics = {name: {**metrics_df.loc[name].to_dict(), "Operating Point": operating_points[name]}
+               for name in results}
+    save_artifact(args.output, preprocessor, models, FEATURE_COLUMNS, fingerprint, metrics)
+    print(f"\nArtefak disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Evaluasi stratified k-fold dan pencarian hyperparameter dengan successive halving.
+
+Setiap fold dipreprocessing sekali (`pipeline.prepare_folds`) dan disimpan sebagai
+file `.npy` di cache. Worker di process pool membuka file tersebut sebagai memmap
+read-only, sehingga matriks fold dibagi lewat page cache OS tanpa disalin per tugas;
+yang dikirim ke worker hanya nama model, parameter dan path fold.
+
+Successive halving memakai jumlah fold sebagai sumber daya: semua kandidat dinilai
+pada fold pertama, lalu hanya 1/`eta` kandidat terbaik per model yang lanjut ke
+fold berikutnya, sampai kandidat tersisa dinilai pada semua fold. Skor fold yang
+sudah dihitung dipakai ulang antar-ronde. Hasil akhirnya mean/std setiap metrik.
+
+Contoh penggunaan:
+    python tuning.py --folds 5 --jobs -1
+    python tuning.py --search --metric Recall --eta 3 --output cv_results.csv
+"""
+
+import argparse
+import json
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import ParameterGrid
+from threadpoolctl import threadpool_limits
+
+from columnar import DEFAULT_DATA_CACHE_DIR, open_data
+from instrumentation import stage
+from metrics import ThresholdCurve, predict_with_scores
+from pipeline import (APPROX_SVM_NAME, METRIC_NAMES, build_models, evaluate, prepare_folds,
+                      split_core_budget)
+from preprocessing import DEFAULT_CACHE_DIR, load_cached
+
+CV_METRICS = METRIC_NAMES + ["ROC AUC", "Fit Time (s)"]
+
+PARAM_GRIDS = {
+    "Logistic Regression": {
+        "C": [0.01, 0.1, 1.0, 10.0],
+        "class_weight": [None, "balanced"],
+    },
+    "Random Forest": {
+        "n_estimators": [100, 300],
+        "max_depth": [None, 5, 10],
+        "min_samples_leaf": [1, 5],
+        "class_weight": [None, "balanced"],
+    },
+    "SVM": {
+        "C": [0.1, 1.0, 10.0],
+        "gamma": ["scale", 0.01, 0.1],
+        "class_weight": [None, "balanced"],
+    },
+    APPROX_SVM_NAME: {
+        "nystroem__n_components": [100, 300],
+        "sgdclassifier__alpha": [1e-5, 1e-4, 1e-3],
+        "sgdclassifier__class_weight": [None, "balanced"],
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _open_fold(directory):
+    # Dibuka sekali per proses worker; array berupa memmap read-only
+    _, X_train, X_val, y_train, y_val = load_cached(directory)
+    return X_train, X_val, y_train, y_val
+
+
+def _evaluate_candidate(name, params, directory, n_threads=1):
+    """Melatih satu kandidat pada satu fold; mengembalikan dict skor `CV_METRICS`."""
+    X_train, X_val, y_train, y_val = _open_fold(directory)
+    model = build_models(svm_mode="both")[name].set_params(**params)
+    if isinstance(model, RandomForestClassifier):
+        model.set_params(n_jobs=n_threads)
+    with threadpool_limits(limits=n_threads):
+        with stage(f"cv_fit:{name}", rows=len(X_train)):
+            start = time.perf_counter()
+            model.fit(X_train, y_train)
+            fit_time = time.perf_counter() - start
+        y_pred, y_score = predict_with_scores(model, X_val)
+    scores, _ = evaluate(y_val, y_pred)
+    return {**dict(zip(METRIC_NAMES, scores)), "ROC AUC": ThresholdCurve(y_val, y_score).roc_auc(),
+            "Fit Time (s)": fit_time}
+
+
+def build_candidates(model_names, search=False):
+    """Daftar `(nama_model, params)`; tanpa `search` hanya parameter default setiap model."""
+    if not search:
+        return [(name, {}) for name in model_names]
+    return [(name, params) for name in model_names for params in ParameterGrid(PARAM_GRIDS[name])]
+
+
+def successive_halving(candidates, fold_dirs, metric="F1-Score", eta=3, min_folds=1, n_jobs=1):
+    """Menilai `candidates` pada `fold_dirs` dengan successive halving per model.
+
+    Pada ronde ke-r setiap kandidat yang masih bertahan dinilai sampai
+    `min(k, min_folds * eta**r)` fold; setelah itu hanya `ceil(n / eta)` kandidat
+    dengan rata-rata `metric` tertinggi dalam model yang sama yang lanjut.
+    Mengembalikan `(fold_scores, eliminated)`: list skor per fold untuk setiap
+    kandidat, dan ronde saat kandidat dihentikan (None untuk yang bertahan).
+    """
+    n_folds = len(fold_dirs)
+    fold_scores = [[] for _ in candidates]
+    eliminated = [None] * len(candidates)
+    alive = list(range(len(candidates)))
+    n_processes, n_threads = split_core_budget(n_jobs, len(candidates) * n_folds)
+    executor = ProcessPoolExecutor(max_workers=n_processes) if n_processes > 1 else None
+    try:
+        done, round_ = 0, 0
+        while True:
+            target = min(n_folds, min_folds * eta ** round_)
+            tasks = [(i, k) for i in alive for k in range(done, target)]
+            with stage("cv_round", round=round_, candidates=len(alive), tasks=len(tasks)):
+                args = [(candidates[i][0], candidates[i][1], fold_dirs[k], n_threads) for i, k in tasks]
+                if executor is None:
+                    outputs = [_evaluate_candidate(*a) for a in args]
+                else:
+                    outputs = list(executor.map(_evaluate_candidate, *zip(*args)))
+            for (i, _), output in zip(tasks, outputs):
+                fold_scores[i].append(output)
+            done = target
+            if done == n_folds:
+                return fold_scores, eliminated
+
+            survivors = []
+            for name in dict.fromkeys(candidates[i][0] for i in alive):
+                group = [i for i in alive if candidates[i][0] == name]
+                group.sort(key=lambda i: -np.mean([s[metric] for s in fold_scores[i]]))
+                keep = math.ceil(len(group) / eta)
+                survivors += group[:keep]
+                for i in group[keep:]:
+                    eliminated[i] = round_
+            alive = sorted(survivors)
+            round_ += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def summarize(candidates, fold_scores, eliminated):
+    """Tabel hasil: satu baris per kandidat dengan mean/std setiap metrik."""
+    rows = []
+    for (name, params), scores, out in zip(candidates, fold_scores, eliminated):
+        row = {"Model": name, "Params": json.dumps(params), "Folds": len(scores),
+               "Dihentikan di ronde": out}
+        for metric in CV_METRICS:
+            values = np.array([s[metric] for s in scores])
+            row[f"{metric} mean"] = values.mean()
+            row[f"{metric} std"] = values.std()
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def best_per_model(table, metric="F1-Score"):
+    """Kandidat terbaik setiap model di antara yang dinilai pada semua fold."""
+    full = table[table["Folds"] == table["Folds"].max()]
+    best = full.loc[full.groupby("Model", sort=False)[f"{metric} mean"].idxmax()]
+    return best.set_index("Model")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluasi k-fold dan pencarian hyperparameter.")
+    parser.add_argument("--data", default="dataset.csv")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--search", action="store_true", help="Cari hyperparameter dari PARAM_GRIDS")
+    parser.add_argument("--models", nargs="+", default=list(PARAM_GRIDS), choices=list(PARAM_GRIDS))
+    parser.add_argument("--metric", default="F1-Score", choices=CV_METRICS[:-1],
+                        help="Metrik untuk memilih kandidat yang lanjut")
+    parser.add_argument("--eta", type=int, default=3, help="Faktor pengurangan kandidat per ronde")
+    parser.add_argument("--jobs", type=int, default=1, help="Budget core untuk process pool (-1 = semua core)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Direktori cache fold hasil preprocessing")
+    parser.add_argument("--data-cache-dir", default=DEFAULT_DATA_CACHE_DIR,
+                        help="Direktori cache kolumnar (.npy) data mentah")
+    parser.add_argument("--output", help="Simpan tabel semua kandidat sebagai CSV")
+    args = parser.parse_args()
+
+    with stage("load", source="columnar") as s:
+        data, _ = open_data(args.data, args.data_cache_dir)
+        s.rows = len(data)
+    fold_dirs = prepare_folds(data.frame(), args.cache_dir, n_splits=args.folds, fingerprint=data.fingerprint["sha256"])
+    candidates = build_candidates(args.models, args.search)
+    print(f"Jumlah kandidat: {len(candidates)} | Jumlah fold: {len(fold_dirs)}")
+
+    start = time.perf_counter()
+    fold_scores, eliminated = successive_halving(candidates, fold_dirs, args.metric, args.eta, n_jobs=args.jobs)
+    elapsed = time.perf_counter() - start
+    table = summarize(candidates, fold_scores, eliminated)
+    n_fits = sum(len(scores) for scores in fold_scores)
+    print(f"Jumlah fit: {n_fits} (tanpa halving: {len(candidates) * len(fold_dirs)}) | Waktu: {elapsed:.1f} detik")
+
+    best = best_per_model(table, args.metric)
+    summary = pd.DataFrame({
+        metric: [f"{m:.3f} ± {s:.3f}" for m, s in zip(best[f"{metric} mean"], best[f"{metric} std"])]
+        for metric in CV_METRICS
+    }, index=best.index)
+    print(f"\nHasil {len(fold_dirs)}-fold (mean ± std):")
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(summary)
+    if args.search:
+        print("\nParameter terbaik:")
+        for name, params in best["Params"].items():
+            print(f"  {name}: {params}")
+    if args.output:
+        table.to_csv(args.output, index=False)
+        print(f"\nTabel kandidat disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()